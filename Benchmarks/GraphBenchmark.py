@@ -0,0 +1,88 @@
+# Timings for the graph algorithms on random graphs, on Graph and on its CSR snapshot.
+#
+#   python -m Benchmarks.GraphBenchmark [--edges 100000,1000000] [--degree 10] [--seed 1] [--output FILE]
+#
+# Prints one JSON document with the seconds each step took per graph size,
+# so runs can be diffed.
+
+import argparse
+import platform
+import random
+import time
+from collections import deque
+from DataStructures.Graphs import Graph
+from DataStructures.GraphAlgorithms import bfs, dfs, shortest_paths, connected_components, UnionFind
+from Benchmarks.Report import write_report
+
+DEFAULT_EDGES = [100000, 1000000]
+DEFAULT_DEGREE = 10
+
+
+def build_graph(edges, degree, rng):
+    """Random weighted graph with the given edge count and average degree"""
+    vertices = max(2, edges * 2 // degree)
+    graph = Graph()
+    for vertex in range(vertices):
+        graph.add_vertex(vertex)
+    added = 0
+    while added < edges:
+        if graph.add_edge(rng.randrange(vertices), rng.randrange(vertices), rng.randint(1, 100)):
+            added += 1
+    return graph
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return round(time.perf_counter() - start, 4), result
+
+
+def exhaust(iterator):
+    deque(iterator, maxlen=0)
+
+
+def run(edge_counts, degree, seed):
+    results = []
+    for edges in edge_counts:
+        rng = random.Random(seed)
+        result = {'edges': edges}
+        result['build_s'], graph = timed(lambda: build_graph(edges, degree, rng))
+        result['vertices'] = len(graph.adj_list)
+        result['freeze_s'], snapshot = timed(graph.freeze)
+        source = next(iter(graph.adj_list))
+
+        for name, target in (('graph', graph), ('csr', snapshot)):
+            result[name + '_bfs_s'], _ = timed(lambda: exhaust(bfs(target, source)))
+            result[name + '_dfs_s'], _ = timed(lambda: exhaust(dfs(target, source)))
+            result[name + '_dijkstra_s'], _ = timed(lambda: shortest_paths(target, source))
+            result[name + '_components_s'], components = timed(lambda: sum(1 for _ in connected_components(target)))
+        result['components'] = components
+
+        result['union_find_s'], union_find = timed(lambda: UnionFind.from_graph(graph))
+        assert union_find.component_count() == components
+        results.append(result)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the graph algorithms on random graphs")
+    parser.add_argument('--edges', default=",".join(str(edges) for edges in DEFAULT_EDGES))
+    parser.add_argument('--degree', type=int, default=DEFAULT_DEGREE)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    edge_counts = [int(edges) for edges in args.edges.split(",")]
+    report = {
+        'benchmark': 'graph',
+        'python': platform.python_version(),
+        'degree': args.degree,
+        'seed': args.seed,
+        'results': run(edge_counts, args.degree, args.seed),
+    }
+
+    write_report(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
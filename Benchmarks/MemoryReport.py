@@ -0,0 +1,100 @@
+# Bytes per element of the linked structures, measured with tracemalloc.
+#
+#   python -m Benchmarks.MemoryReport [--elements 1000000] [--output FILE]
+#
+# Every element holds the same small int, so the numbers are the cost of
+# the structure itself. "dict_nodes" rebuilds the original nodes, which had
+# an instance __dict__, as the before figure for the slotted and pooled ones.
+
+import argparse
+import gc
+import platform
+import tracemalloc
+from DataStructures.LinkedList import LinkedList, PooledLinkedList
+from DataStructures.DoublyLinkedList import DoublyLinkedList, PooledDoublyLinkedList
+from DataStructures.Queue import Queue, PooledQueue, RingBufferQueue
+from DataStructures.Stack import Stack, PooledStack, ArrayStack
+from Benchmarks.Report import write_report
+
+DEFAULT_ELEMENTS = 1000000
+
+
+class DictNode:
+    def __init__(self, value):
+        self.value = value
+        self.next = None
+
+
+def dict_nodes(elements):
+    """A chain of __dict__ nodes like the singly linked ones used before"""
+    head = DictNode(0)
+    current = head
+    for _ in range(elements - 1):
+        current.next = DictNode(0)
+        current = current.next
+    return head
+
+
+def filled(make, add, elements):
+    def build():
+        structure = make()
+        method = getattr(structure, add)
+        for _ in range(elements - 1):
+            method(0)
+        return structure
+    return build
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    structure = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+    return size
+
+
+def run(elements):
+    builds = [
+        ('dict_nodes', lambda: dict_nodes(elements)),
+        ('LinkedList', filled(lambda: LinkedList(0), 'append', elements)),
+        ('PooledLinkedList', filled(lambda: PooledLinkedList(0), 'append', elements)),
+        ('DoublyLinkedList', filled(lambda: DoublyLinkedList(0), 'append', elements)),
+        ('PooledDoublyLinkedList', filled(lambda: PooledDoublyLinkedList(0), 'append', elements)),
+        ('Queue', filled(lambda: Queue(0), 'enqueue', elements)),
+        ('PooledQueue', filled(lambda: PooledQueue(0), 'enqueue', elements)),
+        ('RingBufferQueue', filled(lambda: RingBufferQueue(0), 'enqueue', elements)),
+        ('Stack', filled(lambda: Stack(0), 'push', elements)),
+        ('PooledStack', filled(lambda: PooledStack(0), 'push', elements)),
+        ('ArrayStack', filled(lambda: ArrayStack([0]), 'push', elements)),
+    ]
+    results = []
+    for name, build in builds:
+        size = measure(build)
+        results.append({
+            'structure': name,
+            'elements': elements,
+            'bytes': size,
+            'bytes_per_element': round(size / elements, 2),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report the memory used per element by the linked structures")
+    parser.add_argument('--elements', type=int, default=DEFAULT_ELEMENTS)
+    parser.add_argument('--output', help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    report = {
+        'benchmark': 'memory',
+        'python': platform.python_version(),
+        'results': run(args.elements),
+    }
+
+    write_report(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
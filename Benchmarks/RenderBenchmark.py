@@ -0,0 +1,148 @@
+# Frame-time benchmark for the visualizers, run headless on SDL's dummy driver.
+#
+#   python -m Benchmarks.RenderBenchmark [--frames N] [--sizes 10,1000,100000] [--output FILE]
+#
+# Prints one JSON document with p50/p95/p99 frame times and draw calls per
+# frame for each screen, scenario and structure size, so runs can be diffed.
+
+import os
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # Keep stdout pure JSON
+
+import argparse
+import platform
+import time
+import pygame
+from main import WIDTH, HEIGHT, create_window
+from DataStructures.LinkedList import LinkedList
+from Visualizers.LinkedListVisualizer import LinkedListVisualizer
+from Visualizers.MenuSystem import MainMenu, SelectionMenu
+from Benchmarks.Report import write_report
+
+DEFAULT_SIZES = [10, 1000, 100000]
+DEFAULT_FRAMES = 200
+
+
+class CountingSurface(pygame.Surface):
+    """Offscreen target that counts the blit and fill calls made on it"""
+
+    calls = 0
+
+    def blit(self, *args, **kwargs):
+        CountingSurface.calls += 1
+        return super().blit(*args, **kwargs)
+
+    def blits(self, blit_sequence, *args, **kwargs):
+        blit_sequence = list(blit_sequence)
+        CountingSurface.calls += len(blit_sequence)
+        return super().blits(blit_sequence, *args, **kwargs)
+
+    def fill(self, *args, **kwargs):
+        CountingSurface.calls += 1
+        return super().fill(*args, **kwargs)
+
+
+def count_draw_primitives():
+    """Wrap the pygame.draw functions so they add to CountingSurface.calls"""
+    def counted(function):
+        def wrapper(*args, **kwargs):
+            CountingSurface.calls += 1
+            return function(*args, **kwargs)
+        return wrapper
+
+    for name in ('circle', 'rect', 'line', 'lines', 'polygon', 'aaline', 'ellipse', 'arc'):
+        setattr(pygame.draw, name, counted(getattr(pygame.draw, name)))
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    index = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def measure(frame, frames):
+    """Run frame() the given number of times and summarize the timings"""
+    # One untimed frame so font and sprite caches are warm
+    frame()
+    timings = []
+    calls = 0
+    for _ in range(frames):
+        CountingSurface.calls = 0
+        start = time.perf_counter()
+        frame()
+        timings.append((time.perf_counter() - start) * 1000)
+        calls += CountingSurface.calls
+    timings.sort()
+    return {
+        'frames': frames,
+        'p50_ms': round(percentile(timings, 0.50), 4),
+        'p95_ms': round(percentile(timings, 0.95), 4),
+        'p99_ms': round(percentile(timings, 0.99), 4),
+        'draw_calls_per_frame': round(calls / frames, 2),
+    }
+
+
+def full_redraw(screen):
+    """A frame that repaints the whole screen"""
+    def frame():
+        screen.invalidate()
+        screen.draw()
+    return frame
+
+
+def build_list(size):
+    linked_list = LinkedList(0)
+    for value in range(1, size):
+        linked_list.append(value)
+    return linked_list
+
+
+def run(sizes, frames):
+    target = CountingSurface((WIDTH, HEIGHT))
+    results = []
+
+    def record(screen, scenario, size, frame):
+        result = {'screen': screen, 'scenario': scenario, 'size': size}
+        result.update(measure(frame, frames))
+        results.append(result)
+
+    record('MainMenu', 'full_redraw', None, full_redraw(MainMenu(target, WIDTH, HEIGHT)))
+    record('SelectionMenu', 'full_redraw', None, full_redraw(SelectionMenu(target, WIDTH, HEIGHT)))
+
+    for size in sizes:
+        visualizer = LinkedListVisualizer(target, WIDTH, HEIGHT)
+        visualizer.set_linked_list(build_list(size))
+        record('LinkedListVisualizer', 'full_redraw', size, full_redraw(visualizer))
+
+        # An append every frame: layout update plus a partial repaint
+        def append_frame(visualizer=visualizer):
+            visualizer.linked_list.append(0)
+            visualizer.draw()
+        record('LinkedListVisualizer', 'append', size, append_frame)
+
+        # Nothing changed: the cost of an idle frame
+        record('LinkedListVisualizer', 'idle', size, visualizer.draw)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless frame-time benchmark for the visualizers")
+    parser.add_argument('--frames', type=int, default=DEFAULT_FRAMES)
+    parser.add_argument('--sizes', default=",".join(str(size) for size in DEFAULT_SIZES))
+    parser.add_argument('--output', help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    create_window(headless=True)
+    count_draw_primitives()
+    sizes = [int(size) for size in args.sizes.split(",")]
+    report = {
+        'benchmark': 'render',
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'results': run(sizes, args.frames),
+    }
+
+    write_report(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+# Output shared by the benchmark scripts.
+
+import json
+
+
+def write_report(report, path=None):
+    """Write report as indented JSON to path, or print it when path is None"""
+    text = json.dumps(report, indent=2)
+    if path:
+        with open(path, 'w') as output:
+            output.write(text + "\n")
+    else:
+        print(text)
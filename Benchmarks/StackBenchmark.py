@@ -0,0 +1,82 @@
+# Push and pop throughput of the stack implementations against a plain list.
+#
+#   python -m Benchmarks.StackBenchmark [--operations 1000000] [--batch 1000] [--output FILE]
+#
+# Prints one JSON document with seconds per phase for each implementation,
+# so runs can be diffed.
+
+import argparse
+import platform
+import time
+from DataStructures.Stack import Stack, ArrayStack
+from Benchmarks.Report import write_report
+
+DEFAULT_OPERATIONS = 1000000
+DEFAULT_BATCH = 1000
+
+
+def single(make, operations):
+    """Time operations pushes followed by as many pops"""
+    stack = make()
+    push = stack.push if hasattr(stack, 'push') else stack.append
+    start = time.perf_counter()
+    for value in range(operations):
+        push(value)
+    pushed = time.perf_counter()
+    pop = stack.pop
+    for _ in range(operations):
+        pop()
+    popped = time.perf_counter()
+    return {'push_s': round(pushed - start, 4), 'pop_s': round(popped - pushed, 4)}
+
+
+def batched(make, operations, batch):
+    """Time the same work done through push_many and pop_many"""
+    stack = make()
+    start = time.perf_counter()
+    for first in range(0, operations, batch):
+        stack.push_many(range(first, first + batch))
+    pushed = time.perf_counter()
+    for _ in range(0, operations, batch):
+        stack.pop_many(batch)
+    popped = time.perf_counter()
+    return {'push_many_s': round(pushed - start, 4), 'pop_many_s': round(popped - pushed, 4)}
+
+
+def run(operations, batch):
+    # The node-based Stack has to start with a value; it is not counted
+    implementations = [
+        ('Stack', lambda: Stack(0)),
+        ('ArrayStack', ArrayStack),
+        ('ArrayStack[q]', lambda: ArrayStack(typecode='q')),
+        ('list', list),
+    ]
+    results = []
+    for name, make in implementations:
+        result = {'implementation': name, 'operations': operations}
+        result.update(single(make, operations))
+        if name.startswith('ArrayStack'):
+            result.update(batched(make, operations, batch))
+        results.append(result)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the stack implementations")
+    parser.add_argument('--operations', type=int, default=DEFAULT_OPERATIONS)
+    parser.add_argument('--batch', type=int, default=DEFAULT_BATCH)
+    parser.add_argument('--output', help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    report = {
+        'benchmark': 'stack',
+        'python': platform.python_version(),
+        'batch': args.batch,
+        'results': run(args.operations, args.batch),
+    }
+
+    write_report(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,33 +1,113 @@
+from DataStructures.Observable import Observable, Inserted, Removed
+
+
 class Node:
     def __init__(self, value):
         self.value = value
         self.left = None
         self.right = None
-        
+        # Number of nodes in the subtree rooted here, for select and rank
+        self.size = 1
+
+
+def _size(node):
+    return node.size if node is not None else 0
+
+
+class BinarySearchTree(Observable):
+    _node_class = Node
 
-class BinarySearchTree:
     def __init__(self):
         self.root = None
 
+    @classmethod
+    def from_sorted(cls, iterable):
+        """Build a perfectly balanced tree from ascending values in O(n)
+
+        Repeated values are kept once, like insert does.
+        """
+        values = []
+        for value in iterable:
+            if values and not values[-1] < value:
+                if values[-1] == value:
+                    continue
+                raise ValueError("from_sorted needs values in ascending order")
+            values.append(value)
+        tree = cls()
+        tree.root = tree._build(values, 0, len(values))
+        return tree
+
+    def _build(self, values, lo, hi):
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = self._node_class(values[mid])
+        node.left = self._build(values, lo, mid)
+        node.right = self._build(values, mid + 1, hi)
+        self._update(node)
+        return node
+
+    def _update(self, node):
+        """Recompute the fields node derives from its children"""
+        node.size = 1 + _size(node.left) + _size(node.right)
+
+    def __len__(self):
+        return _size(self.root)
+
+    def __iter__(self):
+        """Yield the values in ascending order"""
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
+
+    def __reversed__(self):
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.right
+            node = stack.pop()
+            yield node.value
+            node = node.left
+
+    def __contains__(self, value):
+        return self.contains(value)
+
     def insert(self, value):
         new_node = Node(value)
         if self.root is None:
             self.root = new_node
+            if self._observers:
+                self._notify(Inserted(None, value))
             return True
         temp = self.root
+        path = []
         while (True):
             if new_node.value == temp.value:
                 return False
+            path.append(temp)
             if new_node.value < temp.value:
                 if temp.left is None:
                     temp.left = new_node
-                    return True
+                    break
                 temp = temp.left
             else: 
                 if temp.right is None:
                     temp.right = new_node
-                    return True
+                    break
                 temp = temp.right
+        for node in path:
+            node.size += 1
+        if self._observers:
+            self._notify(Inserted(None, value))
+        return True
 
     def contains(self, value):
         temp = self.root
@@ -38,4 +118,219 @@ class BinarySearchTree:
                 temp = temp.right
             else:
                 return True
-        return False
\ No newline at end of file
+        return False
+
+    def delete(self, value):
+        path = []
+        node = self.root
+        while node is not None and node.value != value:
+            path.append(node)
+            node = node.left if value < node.value else node.right
+        if node is None:
+            return False
+        if node.left is not None and node.right is not None:
+            # Two children: take over the in-order successor's value and unlink it instead
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.value = successor.value
+            node = successor
+        child = node.left if node.left is not None else node.right
+        self._replace_child(path[-1] if path else None, node, child)
+        for ancestor in path:
+            ancestor.size -= 1
+        if self._observers:
+            self._notify(Removed(None, value))
+        return True
+
+    def height(self):
+        """Number of levels, counted breadth first"""
+        levels = 0
+        level = [self.root] if self.root is not None else []
+        while level:
+            levels += 1
+            level = [child for node in level for child in (node.left, node.right) if child is not None]
+        return levels
+
+    def _replace_child(self, parent, old, new):
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
+
+    # Order statistics
+    def select(self, k):
+        """Return the k-th smallest value, counting from 0"""
+        if not 0 <= k < _size(self.root):
+            raise IndexError("select index out of range")
+        node = self.root
+        while True:
+            left_size = _size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k > left_size:
+                k -= left_size + 1
+                node = node.right
+            else:
+                return node.value
+
+    def rank(self, value):
+        """Return how many values in the tree are smaller than value"""
+        smaller = 0
+        node = self.root
+        while node is not None:
+            if value <= node.value:
+                node = node.left
+            else:
+                smaller += _size(node.left) + 1
+                node = node.right
+        return smaller
+
+    def range(self, lo, hi):
+        """Yield the values in [lo, hi] in ascending order, lazily"""
+        # In-order walk that skips subtrees wholly outside the range
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                if node.value < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if node.value > hi:
+                return
+            yield node.value
+            node = node.right
+
+
+class AVLNode(Node):
+    def __init__(self, value):
+        super().__init__(value)
+        self.height = 1
+
+
+def _height(node):
+    return node.height if node is not None else 0
+
+
+class AVLTree(BinarySearchTree):
+    """BinarySearchTree that rebalances after every insert and delete"""
+
+    _node_class = AVLNode
+
+    def __init__(self):
+        super().__init__()
+        # Cumulative count of single rotations (a double rotation counts as two)
+        self.rotations = 0
+
+    def insert(self, value):
+        # Remember the path down so only those nodes are rebalanced
+        path = []
+        node = self.root
+        while node is not None:
+            if value == node.value:
+                return False
+            path.append(node)
+            node = node.left if value < node.value else node.right
+
+        new_node = AVLNode(value)
+        for node in path:
+            node.size += 1
+        if not path:
+            self.root = new_node
+        elif value < path[-1].value:
+            path[-1].left = new_node
+        else:
+            path[-1].right = new_node
+        self._rebalance_path(path)
+        if self._observers:
+            self._notify(Inserted(None, value))
+        return True
+
+    def delete(self, value):
+        path = []
+        node = self.root
+        while node is not None and node.value != value:
+            path.append(node)
+            node = node.left if value < node.value else node.right
+        if node is None:
+            return False
+        if node.left is not None and node.right is not None:
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.value = successor.value
+            node = successor
+        child = node.left if node.left is not None else node.right
+        self._replace_child(path[-1] if path else None, node, child)
+        for ancestor in path:
+            ancestor.size -= 1
+        self._rebalance_path(path)
+        if self._observers:
+            self._notify(Removed(None, value))
+        return True
+
+    def height(self):
+        return _height(self.root)
+
+    def reset_rotations(self):
+        self.rotations = 0
+
+    def _update(self, node):
+        node.size = 1 + _size(node.left) + _size(node.right)
+        node.height = 1 + max(_height(node.left), _height(node.right))
+
+    # Rebalancing
+    def _rebalance_path(self, path):
+        """Fix heights and balance from the deepest node on path up to the root"""
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            old_height = node.height
+            balanced = self._rebalance(node)
+            if balanced is not node:
+                self._replace_child(path[i - 1] if i else None, node, balanced)
+            # Nothing above can change once a subtree keeps its height
+            if balanced.height == old_height:
+                break
+
+    def _rebalance(self, node):
+        """Return the root of node's subtree after restoring the AVL property"""
+        balance = _height(node.left) - _height(node.right)
+        if balance > 1:
+            if _height(node.left.left) < _height(node.left.right):
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if balance < -1:
+            if _height(node.right.right) < _height(node.right.left):
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        self._update(node)
+        return node
+
+    def _rotate_left(self, node):
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update(node)
+        self._update(pivot)
+        self.rotations += 1
+        return pivot
+
+    def _rotate_right(self, node):
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update(node)
+        self._update(pivot)
+        self.rotations += 1
+        return pivot
@@ -1,17 +1,46 @@
+from DataStructures.Observable import Observable, Inserted, Removed, Updated, Reordered
+from DataStructures.ListSort import merge_runs, merge_sort_steps, SortMerge
+from DataStructures.NodePool import NodePool, NIL
+
+
 class Node:
+    __slots__ = ('value', 'next', 'prev')
+
     def __init__(self, value):
         self.value = value
         self.next = None
         self.prev = None
         
 
-class DoublyLinkedList:
+class DoublyLinkedList(Observable):
+    # Last node reached by position and its index; get starts from
+    # whichever of head, tail and finger is nearest
+    _finger = None
+    _finger_index = 0
+
     def __init__(self, value):
         new_node = Node(value)
         self.head = new_node
         self.tail = new_node
         self.length = 1
 
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        """Yield the values from head to tail"""
+        temp = self.head
+        while temp is not None:
+            yield temp.value
+            temp = temp.next
+
+    def __reversed__(self):
+        """Yield the values from tail to head"""
+        temp = self.tail
+        while temp is not None:
+            yield temp.value
+            temp = temp.prev
+
     def print_list(self):
         temp = self.head
         while temp is not None:
@@ -28,6 +57,8 @@ class DoublyLinkedList:
             new_node.prev = self.tail
             self.tail = new_node
         self.length += 1
+        if self._observers:
+            self._notify(Inserted(self.length - 1, value))
         return True
 
     def pop(self):
@@ -42,6 +73,9 @@ class DoublyLinkedList:
             self.tail.next = None
             temp.prev = None
         self.length -= 1
+        self._finger_removed(self.length)
+        if self._observers:
+            self._notify(Removed(self.length, temp.value))
         return temp
 
     def prepend(self, value):
@@ -54,6 +88,9 @@ class DoublyLinkedList:
             self.head.prev = new_node
             self.head = new_node
         self.length += 1
+        self._finger_inserted(0)
+        if self._observers:
+            self._notify(Inserted(0, value))
         return True
 
     def pop_first(self):
@@ -68,25 +105,53 @@ class DoublyLinkedList:
             self.head.prev = None
             temp.next = None      
         self.length -= 1
+        self._finger_removed(0)
+        if self._observers:
+            self._notify(Removed(0, temp.value))
         return temp
 
     def get(self, index):
         if index < 0 or index >= self.length:
             return None
+        return self._walk(index)
+
+    def _walk(self, index):
+        """Return the node at a valid index, from the nearest of head, tail and finger"""
         temp = self.head
-        if index < self.length/2:
-            for _ in range(index):
+        start = 0
+        if self.length - 1 - index < index:
+            temp = self.tail
+            start = self.length - 1
+        if self._finger is not None and abs(self._finger_index - index) < abs(start - index):
+            temp = self._finger
+            start = self._finger_index
+        if start <= index:
+            for _ in range(index - start):
                 temp = temp.next
         else:
-            temp = self.tail
-            for _ in range(self.length - 1, index, -1):
-                temp = temp.prev  
+            for _ in range(start - index):
+                temp = temp.prev
+        self._finger = temp
+        self._finger_index = index
         return temp
+
+    def _finger_inserted(self, index):
+        if self._finger is not None and self._finger_index >= index:
+            self._finger_index += 1
+
+    def _finger_removed(self, index):
+        if self._finger is not None:
+            if self._finger_index == index:
+                self._finger = None
+            elif self._finger_index > index:
+                self._finger_index -= 1
         
     def set_value(self, index, value):
         temp = self.get(index)
         if temp:
             temp.value = value
+            if self._observers:
+                self._notify(Updated(index, value))
             return True
         return False
     
@@ -98,17 +163,31 @@ class DoublyLinkedList:
         if index == self.length:
             return self.append(value)
 
+        self._link(self._walk(index - 1), index, value)
+        return True
+
+    def _link(self, before, index, value):
+        """Add value after node before (None for the head) as position index; return its node"""
+        if before is None:
+            self.prepend(value)
+            return self.head
+        if before is self.tail:
+            self.append(value)
+            return self.tail
+
         new_node = Node(value)
-        before = self.get(index - 1)
         after = before.next
 
         new_node.prev = before
         new_node.next = after
         before.next = new_node
         after.prev = new_node
-        
-        self.length += 1   
-        return True  
+
+        self.length += 1
+        self._finger_inserted(index)
+        if self._observers:
+            self._notify(Inserted(index, value))
+        return new_node
 
     def remove(self, index):
         if index < 0 or index >= self.length:
@@ -118,13 +197,346 @@ class DoublyLinkedList:
         if index == self.length - 1:
             return self.pop()
 
-        temp = self.get(index)
-        
+        return self._unlink(self._walk(index), index)
+
+    def _unlink(self, temp, index):
+        """Remove node temp, which is at index"""
+        if temp is self.head:
+            return self.pop_first()
+        if temp is self.tail:
+            return self.pop()
+
         temp.next.prev = temp.prev
         temp.prev.next = temp.next
         temp.next = None
         temp.prev = None
 
         self.length -= 1
+        self._finger_removed(index)
+        if self._observers:
+            self._notify(Removed(index, temp.value))
+        return temp
+
+    # Sorting
+    def sort(self, key=None):
+        """Sort the nodes in place with a bottom-up merge sort, O(n log n), stable"""
+        for _ in merge_sort_steps(self, key, True):
+            pass
+        self._relinked()
+        if self._observers:
+            self._notify(Reordered())
+
+    def sort_steps(self, key=None):
+        """Sort like sort(), yielding a SortSplit or SortMerge at every step
+
+        The list is whole between steps, and observers get a Reordered after
+        each merge, so a renderer can show the sort as it runs.
+        """
+        try:
+            for step in merge_sort_steps(self, key, True):
+                if isinstance(step, SortMerge):
+                    self._finger = None
+                    if self._observers:
+                        self._notify(Reordered())
+                yield step
+        finally:
+            self._relinked()
+
+    def sorted_insert(self, value, key=None):
+        """Insert value into an already sorted list, after any equal values"""
+        value_key = value if key is None else key(value)
+        before = None
+        temp = self.head
+        index = 0
+        while temp is not None and (temp.value if key is None else key(temp.value)) <= value_key:
+            before = temp
+            temp = temp.next
+            index += 1
+        self._link(before, index, value)
+        return True
+
+    def merge(self, other, key=None):
+        """Merge the nodes of another sorted list into this sorted one; other ends up empty"""
+        if other is self:
+            raise ValueError("cannot merge a list with itself")
+        if not isinstance(other, DoublyLinkedList):
+            raise TypeError("can only merge another DoublyLinkedList")
+        if other.length == 0:
+            return
+        if self.length == 0:
+            self.head = other.head
+            self.tail = other.tail
+        else:
+            self.head, self.tail = merge_runs(self.head, other.head, key, True)
+        self.length += other.length
+        other.head = None
+        other.tail = None
+        other.length = 0
+        self._relinked()
+        other._relinked()
+        if self._observers:
+            self._notify(Reordered())
+        if other._observers:
+            other._notify(Reordered())
+
+    def _relinked(self):
+        """Called after nodes were relinked wholesale"""
+        self._finger = None
+
+    def cursor(self, index=0):
+        return Cursor(self, index)
+
+
+class Cursor:
+    """A position in a DoublyLinkedList that remembers where it is
+
+    move_to walks from the nearest of head, tail and the cursor, and insert
+    and remove act at the cursor in O(1). Changing the list other than
+    through this cursor invalidates it, as with an iterator. index may equal
+    the list's length, which is the position past the tail.
+    """
+
+    def __init__(self, linked_list, index=0):
+        self.list = linked_list
+        self.index = 0
+        self.node = linked_list.head
+        self.move_to(index)
+
+    @property
+    def value(self):
+        return self.node.value if self.node is not None else None
+
+    def move_to(self, index):
+        length = self.list.length
+        if index < 0 or index > length:
+            raise IndexError("cursor index out of range")
+        if index == length:
+            self.index = index
+            self.node = None
+            return
+        node = self.list.head
+        start = 0
+        if length - 1 - index < index:
+            node = self.list.tail
+            start = length - 1
+        if self.node is not None and abs(self.index - index) < abs(start - index):
+            node = self.node
+            start = self.index
+        if start <= index:
+            for _ in range(index - start):
+                node = node.next
+        else:
+            for _ in range(start - index):
+                node = node.prev
+        self.index = index
+        self.node = node
+
+    def advance(self):
+        """Step to the next position; False once past the end"""
+        if self.index >= self.list.length:
+            return False
+        self.index += 1
+        self.node = self.node.next
+        return True
+
+    def retreat(self):
+        """Step to the previous position; False at the head"""
+        if self.index == 0:
+            return False
+        self.index -= 1
+        self.node = self.node.prev if self.node is not None else self.list.tail
+        return True
+
+    def insert(self, value):
+        """Insert value at the cursor; the cursor then points at it"""
+        before = self.node.prev if self.node is not None else self.list.tail
+        self.node = self.list._link(before, self.index, value)
+
+    def remove(self):
+        """Remove and return the node at the cursor, which moves on to its successor"""
+        if self.node is None:
+            return None
+        after = self.node.next
+        removed = self.list._unlink(self.node, self.index)
+        self.node = after
+        return removed
+  
+
+
+class PooledDoublyLinkedList(Observable):
+    """DoublyLinkedList whose nodes live in a NodePool and link by index
+
+    head, tail and get return NodeViews; removals return a detached Node.
+    """
+
+    def __init__(self, value, pool=None):
+        self.pool = pool if pool is not None else NodePool(doubly=True)
+        if self.pool.prev is None:
+            raise ValueError("PooledDoublyLinkedList needs a NodePool created with doubly=True")
+        index = self.pool.alloc(value)
+        self._head = index
+        self._tail = index
+        self.length = 1
+
+    @property
+    def head(self):
+        return self.pool.view(self._head)
+
+    @property
+    def tail(self):
+        return self.pool.view(self._tail)
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        values = self.pool.values
+        next_index = self.pool.next
+        temp = self._head
+        while temp != NIL:
+            yield values[temp]
+            temp = next_index[temp]
+
+    def __reversed__(self):
+        values = self.pool.values
+        prev_index = self.pool.prev
+        temp = self._tail
+        while temp != NIL:
+            yield values[temp]
+            temp = prev_index[temp]
+
+    def _release(self, index):
+        return Node(self.pool.release(index))
+
+    def print_list(self):
+        temp = self._head
+        while temp != NIL:
+            print(self.pool.values[temp])
+            temp = self.pool.next[temp]
+
+    def append(self, value):
+        index = self.pool.alloc(value)
+        if self.length == 0:
+            self._head = index
+        else:
+            self.pool.next[self._tail] = index
+            self.pool.prev[index] = self._tail
+        self._tail = index
+        self.length += 1
+        if self._observers:
+            self._notify(Inserted(self.length - 1, value))
+        return True
+
+    def pop(self):
+        if self.length == 0:
+            return None
+        temp = self._tail
+        if self.length == 1:
+            self._head = NIL
+            self._tail = NIL
+        else:
+            self._tail = self.pool.prev[temp]
+            self.pool.next[self._tail] = NIL
+        self.length -= 1
+        node = self._release(temp)
+        if self._observers:
+            self._notify(Removed(self.length, node.value))
+        return node
+
+    def prepend(self, value):
+        index = self.pool.alloc(value)
+        if self.length == 0:
+            self._tail = index
+        else:
+            self.pool.next[index] = self._head
+            self.pool.prev[self._head] = index
+        self._head = index
+        self.length += 1
+        if self._observers:
+            self._notify(Inserted(0, value))
+        return True
+
+    def pop_first(self):
+        if self.length == 0:
+            return None
+        temp = self._head
+        if self.length == 1:
+            self._head = NIL
+            self._tail = NIL
+        else:
+            self._head = self.pool.next[temp]
+            self.pool.prev[self._head] = NIL
+        self.length -= 1
+        node = self._release(temp)
+        if self._observers:
+            self._notify(Removed(0, node.value))
+        return node
+
+    def _index_at(self, index):
+        """Walk from whichever end is nearer to index"""
+        if index < self.length / 2:
+            next_index = self.pool.next
+            temp = self._head
+            for _ in range(index):
+                temp = next_index[temp]
+        else:
+            prev_index = self.pool.prev
+            temp = self._tail
+            for _ in range(self.length - 1, index, -1):
+                temp = prev_index[temp]
         return temp
-  
\ No newline at end of file
+
+    def get(self, index):
+        if index < 0 or index >= self.length:
+            return None
+        return self.pool.view(self._index_at(index))
+
+    def set_value(self, index, value):
+        if index < 0 or index >= self.length:
+            return False
+        self.pool.values[self._index_at(index)] = value
+        if self._observers:
+            self._notify(Updated(index, value))
+        return True
+
+    def insert(self, index, value):
+        if index < 0 or index > self.length:
+            return False
+        if index == 0:
+            return self.prepend(value)
+        if index == self.length:
+            return self.append(value)
+
+        new_index = self.pool.alloc(value)
+        before = self._index_at(index - 1)
+        after = self.pool.next[before]
+
+        self.pool.prev[new_index] = before
+        self.pool.next[new_index] = after
+        self.pool.next[before] = new_index
+        self.pool.prev[after] = new_index
+
+        self.length += 1
+        if self._observers:
+            self._notify(Inserted(index, value))
+        return True
+
+    def remove(self, index):
+        if index < 0 or index >= self.length:
+            return None
+        if index == 0:
+            return self.pop_first()
+        if index == self.length - 1:
+            return self.pop()
+
+        temp = self._index_at(index)
+        before = self.pool.prev[temp]
+        after = self.pool.next[temp]
+        self.pool.prev[after] = before
+        self.pool.next[before] = after
+
+        self.length -= 1
+        node = self._release(temp)
+        if self._observers:
+            self._notify(Removed(index, node.value))
+        return node
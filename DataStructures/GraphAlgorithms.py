@@ -0,0 +1,242 @@
+import heapq
+from collections import deque
+from DataStructures.Graphs import CSRGraph
+from DataStructures.Observable import VertexAdded, EdgeAdded
+
+
+# Every algorithm runs on vertex ids through three helpers, so the same code
+# serves a Graph (where a vertex is its own id) and a CSRGraph snapshot
+def _view(graph):
+    """Return (neighbours, to_id, to_vertex) for graph"""
+    if isinstance(graph, CSRGraph):
+        # Slicing the packed arrays per vertex beats copying them into lists:
+        # a list of a million boxed ints is scattered over the heap and costs
+        # more in cache misses than the slices save
+        offsets = graph.offsets
+        targets = graph.targets
+
+        def neighbours(i):
+            return targets[offsets[i]:offsets[i + 1]]
+        return neighbours, graph.index.__getitem__, graph.vertices.__getitem__
+
+    adj_list = graph.adj_list
+    return adj_list.__getitem__, _identity, _identity
+
+
+def _identity(vertex):
+    return vertex
+
+
+def _weighted_view(graph):
+    """Return (edges, to_id, to_vertex) where edges(i) yields (neighbour id, weight)"""
+    if isinstance(graph, CSRGraph):
+        offsets = graph.offsets
+        targets = graph.targets
+        weights = graph.weights
+
+        def edges(i):
+            start = offsets[i]
+            stop = offsets[i + 1]
+            return zip(targets[start:stop], weights[start:stop])
+        return edges, graph.index.__getitem__, graph.vertices.__getitem__
+
+    adj_list = graph.adj_list
+
+    def edges(vertex):
+        return adj_list[vertex].items()
+    return edges, _identity, _identity
+
+
+def _vertex_ids(graph):
+    if isinstance(graph, CSRGraph):
+        return range(len(graph))
+    return graph.adj_list
+
+
+# Traversals
+def bfs(graph, source):
+    """Yield (vertex, depth) in breadth-first order from source, lazily"""
+    neighbours, to_id, to_vertex = _view(graph)
+    start = to_id(source)
+    seen = {start}
+    queue = deque([(start, 0)])
+    while queue:
+        current, depth = queue.popleft()
+        yield to_vertex(current), depth
+        for other in neighbours(current):
+            if other not in seen:
+                seen.add(other)
+                queue.append((other, depth + 1))
+
+
+def dfs(graph, source):
+    """Yield vertices in depth-first preorder from source, lazily"""
+    neighbours, to_id, to_vertex = _view(graph)
+    start = to_id(source)
+    seen = {start}
+    yield to_vertex(start)
+
+    # A stack of neighbour iterators visits vertices in the same order as
+    # the recursive algorithm without its recursion limit
+    stack = [iter(neighbours(start))]
+    while stack:
+        for other in stack[-1]:
+            if other not in seen:
+                seen.add(other)
+                yield to_vertex(other)
+                stack.append(iter(neighbours(other)))
+                break
+        else:
+            stack.pop()
+
+
+def dijkstra(graph, source):
+    """Yield (vertex, distance, previous) as each vertex is settled, nearest first
+
+    Edge weights must not be negative.
+    """
+    edges, to_id, to_vertex = _weighted_view(graph)
+    start = to_id(source)
+    distances = {start: 0}
+    previous = {start: None}
+    settled = set()
+    heap = [(0, 0, start)]
+    # The counter breaks distance ties so vertices themselves are never compared
+    counter = 1
+    while heap:
+        distance, _, current = heapq.heappop(heap)
+        if current in settled:
+            continue
+        settled.add(current)
+        parent = previous[current]
+        yield to_vertex(current), distance, None if parent is None else to_vertex(parent)
+
+        for other, weight in edges(current):
+            if weight < 0:
+                raise ValueError("dijkstra needs non-negative edge weights")
+            candidate = distance + weight
+            if other in settled:
+                continue
+            if other not in distances or candidate < distances[other]:
+                distances[other] = candidate
+                previous[other] = current
+                heapq.heappush(heap, (candidate, counter, other))
+                counter += 1
+
+
+def shortest_paths(graph, source):
+    """Return (distances, previous) dicts for every vertex reachable from source"""
+    distances = {}
+    previous = {}
+    for vertex, distance, parent in dijkstra(graph, source):
+        distances[vertex] = distance
+        previous[vertex] = parent
+    return distances, previous
+
+
+def shortest_path(graph, source, target):
+    """Return (distance, path) from source to target, or (None, None) if unreachable"""
+    previous = {}
+    for vertex, distance, parent in dijkstra(graph, source):
+        previous[vertex] = parent
+        if vertex == target:
+            path = [vertex]
+            while previous[path[-1]] is not None:
+                path.append(previous[path[-1]])
+            path.reverse()
+            return distance, path
+    return None, None
+
+
+def connected_components(graph):
+    """Yield each connected component as a list of vertices, lazily"""
+    neighbours, _, to_vertex = _view(graph)
+    seen = set()
+    for start in _vertex_ids(graph):
+        if start in seen:
+            continue
+        seen.add(start)
+        component = [start]
+        stack = [start]
+        while stack:
+            for other in neighbours(stack.pop()):
+                if other not in seen:
+                    seen.add(other)
+                    component.append(other)
+                    stack.append(other)
+        yield [to_vertex(vertex) for vertex in component]
+
+
+class UnionFind:
+    """Disjoint sets with union by size and path halving
+
+    Unknown elements are added on first use. watch(graph) keeps the sets in
+    step with a Graph as vertices and edges are added; removals cannot be
+    undone in a union-find, so they mark it stale instead.
+    """
+
+    def __init__(self, elements=()):
+        self.parent = {}
+        self.size = {}
+        self.count = 0
+        self.stale = False
+        for element in elements:
+            self.add(element)
+
+    @classmethod
+    def from_graph(cls, graph):
+        union_find = cls(graph.adj_list)
+        for vertex, neighbours in graph.adj_list.items():
+            for other in neighbours:
+                union_find.union(vertex, other)
+        return union_find
+
+    def add(self, element):
+        if element in self.parent:
+            return False
+        self.parent[element] = element
+        self.size[element] = 1
+        self.count += 1
+        return True
+
+    def find(self, element):
+        parent = self.parent
+        if element not in parent:
+            self.add(element)
+            return element
+        while parent[element] != element:
+            parent[element] = parent[parent[element]]
+            element = parent[element]
+        return element
+
+    def union(self, a, b):
+        """Merge the sets holding a and b; False if they were already one set"""
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return False
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        del self.size[root_b]
+        self.count -= 1
+        return True
+
+    def connected(self, a, b):
+        return self.find(a) == self.find(b)
+
+    def component_count(self):
+        return self.count
+
+    def watch(self, graph):
+        """Apply the graph's future insertions as they happen"""
+        graph.subscribe(self._on_graph_change)
+
+    def _on_graph_change(self, change):
+        if isinstance(change, VertexAdded):
+            self.add(change.vertex)
+        elif isinstance(change, EdgeAdded):
+            self.union(change.u, change.v)
+        else:
+            self.stale = True
@@ -1,38 +1,168 @@
-class Graph:
+from array import array
+from DataStructures.Observable import Observable, VertexAdded, VertexRemoved, EdgeAdded, EdgeRemoved
+
+
+class Graph(Observable):
     def __init__(self):
+        # Each vertex maps its neighbours to edge weights, so edge insert,
+        # delete and lookup are O(1)
         self.adj_list = {}
 
+    def __len__(self):
+        return len(self.adj_list)
+
+    def __iter__(self):
+        return iter(self.adj_list)
+
+    def __contains__(self, vertex):
+        return vertex in self.adj_list
+
+    def edges(self):
+        """Yield each edge once as (v1, v2, weight)"""
+        done = set()
+        for vertex, neighbours in self.adj_list.items():
+            for other, weight in neighbours.items():
+                if other not in done:
+                    yield vertex, other, weight
+            done.add(vertex)
+
     def print_graph(self):
         for vertex in self.adj_list:
-            print(vertex, ':', self.adj_list[vertex])
+            print(vertex, ':', list(self.adj_list[vertex]))
 
     def add_vertex(self, vertex):
-        if vertex not in self.adj_list.keys():
-            self.adj_list[vertex] = []
+        if vertex not in self.adj_list:
+            self.adj_list[vertex] = {}
+            if self._observers:
+                self._notify(VertexAdded(vertex))
             return True
         return False
 
-    def add_edge(self, v1, v2):
-        if v1 in self.adj_list.keys() and v2 in self.adj_list.keys():
-            self.adj_list[v1].append(v2)
-            self.adj_list[v2].append(v1)
+    def add_edge(self, v1, v2, weight=1):
+        if v1 in self.adj_list and v2 in self.adj_list:
+            if v2 in self.adj_list[v1]:
+                return False
+            self.adj_list[v1][v2] = weight
+            self.adj_list[v2][v1] = weight
+            if self._observers:
+                self._notify(EdgeAdded(v1, v2))
             return True
         return False
 
+    def has_edge(self, v1, v2):
+        return v1 in self.adj_list and v2 in self.adj_list[v1]
+
+    def weight(self, v1, v2):
+        return self.adj_list[v1][v2]
+
     def remove_edge(self, v1, v2):
-        if v1 in self.adj_list.keys() and v2 in self.adj_list.keys(): 
-            try:
-                self.adj_list[v1].remove(v2)
-                self.adj_list[v2].remove(v1)
-            except ValueError:
-                pass
+        if v1 in self.adj_list and v2 in self.adj_list: 
+            if v2 in self.adj_list[v1]:
+                del self.adj_list[v1][v2]
+                if v1 != v2:
+                    del self.adj_list[v2][v1]
+                if self._observers:
+                    self._notify(EdgeRemoved(v1, v2))
             return True
         return False
 
     def remove_vertex(self, vertex):
-        if vertex in self.adj_list.keys():
+        if vertex in self.adj_list:
             for other_vertex in self.adj_list[vertex]:
-                self.adj_list[other_vertex].remove(vertex)
+                if other_vertex != vertex:
+                    del self.adj_list[other_vertex][vertex]
+                if self._observers:
+                    self._notify(EdgeRemoved(vertex, other_vertex))
             del self.adj_list[vertex]
+            if self._observers:
+                self._notify(VertexRemoved(vertex))
             return True
-        return False        
\ No newline at end of file
+        return False
+
+    def freeze(self):
+        """Return an immutable CSRGraph snapshot of the current graph"""
+        return CSRGraph(self)
+
+
+class CSRGraph:
+    """Compressed sparse row snapshot of a Graph
+
+    Vertices are numbered 0..n-1 in insertion order. The neighbour ids of
+    vertex i are targets[offsets[i]:offsets[i + 1]], sorted ascending, with
+    the matching edge weights at the same positions in weights. If every
+    weight is an int they stay ints (in a tuple when one is too big for an
+    'l' array); otherwise they are stored as doubles. An undirected edge
+    appears once in each endpoint's row.
+    """
+
+    def __init__(self, graph):
+        self.vertices = tuple(graph.adj_list)
+        self.index = {vertex: i for i, vertex in enumerate(self.vertices)}
+
+        index = self.index
+        offsets = array('l', [0])
+        targets = array('l')
+        weights = []
+        for vertex in self.vertices:
+            row = sorted((index[other], weight) for other, weight in graph.adj_list[vertex].items())
+            targets.extend([target for target, _ in row])
+            weights.extend([weight for _, weight in row])
+            offsets.append(len(targets))
+
+        # Read-only views over the contiguous arrays
+        self.offsets = memoryview(offsets).toreadonly()
+        self.targets = memoryview(targets).toreadonly()
+
+        # Integer weights stay integers, so dijkstra's heap compares the same
+        # int distances on a snapshot as on the Graph rather than floats
+        if all(type(weight) is int for weight in weights):
+            try:
+                self.weights = memoryview(array('l', weights)).toreadonly()
+            except OverflowError:
+                # Too big for a C long: a tuple keeps them exact and read-only
+                self.weights = tuple(weights)
+        else:
+            self.weights = memoryview(array('d', weights)).toreadonly()
+
+    def __len__(self):
+        return len(self.vertices)
+
+    def edge_count(self):
+        """Number of undirected edges; a self-loop counts once"""
+        loops = sum(1 for i in range(len(self.vertices)) if self.has_edge_ids(i, i))
+        return (len(self.targets) - loops) // 2 + loops
+
+    def __iter__(self):
+        return iter(self.vertices)
+
+    def __contains__(self, vertex):
+        return vertex in self.index
+
+    def degree(self, vertex):
+        i = self.index[vertex]
+        return self.offsets[i + 1] - self.offsets[i]
+
+    def neighbor_ids(self, i):
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]
+
+    def neighbors(self, vertex):
+        vertices = self.vertices
+        return [vertices[j] for j in self.neighbor_ids(self.index[vertex])]
+
+    def has_edge_ids(self, i, j):
+        # Rows are sorted, so a binary search finds j
+        lo = self.offsets[i]
+        hi = self.offsets[i + 1]
+        targets = self.targets
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if targets[mid] < j:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo < self.offsets[i + 1] and targets[lo] == j
+
+    def has_edge(self, v1, v2):
+        if v1 not in self.index or v2 not in self.index:
+            return False
+        return self.has_edge_ids(self.index[v1], self.index[v2])
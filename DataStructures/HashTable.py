@@ -1,35 +1,294 @@
-class HashTable:
+import time
+from DataStructures.Observable import Observable, ItemSet, ItemRemoved
+
+# Slot markers: never used, and used but deleted (a tombstone)
+_EMPTY = object()
+_DELETED = object()
+
+# 2^64 / golden ratio: the top bits of hash * _FIBONACCI pick the start
+# slot, which spreads clustered hashes such as consecutive ints
+# (Fibonacci hashing)
+_FIBONACCI = 11400714819323198485
+_MASK64 = (1 << 64) - 1
+
+
+class HashTable(Observable):
+    # Grow once live entries plus tombstones fill this share of the slots
+    MAX_LOAD = 2 / 3
+
     def __init__(self, size = 7):
-        self.data_map = [None] * size
-      
-    def __hash(self, key):
-        my_hash = 0
-        for letter in key:
-            my_hash = (my_hash + ord(letter) * 23) % len(self.data_map)
-        return my_hash  
+        capacity = 8
+        while capacity < size:
+            capacity *= 2
+        self._allocate(capacity)
+
+        # Cumulative counters, reported by metrics()
+        self.hashes_computed = 0
+        self.lookups = 0
+        self.lookup_probes = 0  # Slots inspected by get_item and remove_item
+        self.inserts = 0
+        self.insert_probes = 0  # Slots inspected by set_item
+        self.resize_count = 0
+        self.resize_history = []
+
+    def _allocate(self, capacity):
+        self.capacity = capacity
+        self._mask = capacity - 1
+        self._shift = 64 - (capacity.bit_length() - 1)
+        self._limit = int(capacity * self.MAX_LOAD)
+
+        # Open addressing: parallel slot arrays probed linearly
+        self._keys = [_EMPTY] * capacity
+        self._values = [None] * capacity
+        self._hashes = [0] * capacity
+        self.count = 0
+        self.deleted = 0
+
+    def __len__(self):
+        return self.count
 
     def print_table(self):
-        for i, val in enumerate(self.data_map): 
-            print(i, ": ", val)
-    
+        for i, key in enumerate(self._keys):
+            if key is _EMPTY:
+                print(i, ": ", None)
+            elif key is _DELETED:
+                print(i, ": ", "<deleted>")
+            else:
+                print(i, ": ", [key, self._values[i]])
+
     def set_item(self, key, value):
-        index = self.__hash(key)
-        if self.data_map[index] == None:
-            self.data_map[index] = []
-        self.data_map[index].append([key, value])
-    
+        key_hash = hash(key)
+        self.hashes_computed += 1
+        self.inserts += 1
+        keys = self._keys
+        hashes = self._hashes
+        mask = self._mask
+        index = ((key_hash * _FIBONACCI) & _MASK64) >> self._shift
+        free = -1
+        probes = 1
+        while True:
+            slot_key = keys[index]
+            if slot_key is _EMPTY:
+                break
+            if slot_key is _DELETED:
+                if free < 0:
+                    free = index
+            elif hashes[index] == key_hash and (slot_key is key or slot_key == key):
+                # Existing key: update in place
+                self.insert_probes += probes
+                self._values[index] = value
+                if self._observers:
+                    self._notify(ItemSet(key, value))
+                return
+            index = (index + 1) & mask
+            probes += 1
+        self.insert_probes += probes
+
+        # New key: reuse the first tombstone passed on the way, if any
+        if free >= 0:
+            index = free
+            self.deleted -= 1
+        keys[index] = key
+        hashes[index] = key_hash
+        self._values[index] = value
+        self.count += 1
+        if self.count + self.deleted > self._limit:
+            self._resize()
+        if self._observers:
+            self._notify(ItemSet(key, value))
+
     def get_item(self, key):
-        index = self.__hash(key)
-        if self.data_map[index] is not None:
-            for i in range(len(self.data_map[index])):
-                if self.data_map[index][i][0] == key:
-                    return self.data_map[index][i][1]
-        return None
+        index = self._find(key)
+        if index < 0:
+            return None
+        return self._values[index]
+
+    def remove_item(self, key):
+        """Delete key, leaving a tombstone so later probes keep going"""
+        index = self._find(key)
+        if index < 0:
+            return False
+        self._keys[index] = _DELETED
+        self._values[index] = None
+        self.count -= 1
+        self.deleted += 1
+        if self._observers:
+            self._notify(ItemRemoved(key))
+        return True
+
+    def _find(self, key):
+        """Return the slot holding key, or -1"""
+        key_hash = hash(key)
+        self.hashes_computed += 1
+        self.lookups += 1
+        keys = self._keys
+        hashes = self._hashes
+        mask = self._mask
+        index = ((key_hash * _FIBONACCI) & _MASK64) >> self._shift
+        probes = 1
+        while True:
+            slot_key = keys[index]
+            if slot_key is _EMPTY:
+                index = -1
+                break
+            if (slot_key is not _DELETED and hashes[index] == key_hash and
+                    (slot_key is key or slot_key == key)):
+                break
+            index = (index + 1) & mask
+            probes += 1
+        self.lookup_probes += probes
+        return index
+
+    def _resize(self):
+        """Rebuild into a larger table, or the same size if tombstones filled it"""
+        started = time.perf_counter()
+        old_capacity = self.capacity
+        capacity = old_capacity
+        if self.count * 2 > self._limit:
+            # Quadruple so the total rehashing work stays a small share of the inserts
+            capacity *= 4
+        old_keys = self._keys
+        old_values = self._values
+        old_hashes = self._hashes
+        self._allocate(capacity)
+
+        # Keys are known to be distinct, so only an empty slot has to be found
+        keys = self._keys
+        values = self._values
+        hashes = self._hashes
+        mask = self._mask
+        shift = self._shift
+        count = 0
+        for i, key in enumerate(old_keys):
+            if key is _EMPTY or key is _DELETED:
+                continue
+            key_hash = old_hashes[i]
+            index = ((key_hash * _FIBONACCI) & _MASK64) >> shift
+            while keys[index] is not _EMPTY:
+                index = (index + 1) & mask
+            keys[index] = key
+            values[index] = old_values[i]
+            hashes[index] = key_hash
+            count += 1
+        self.count = count
 
+        self.resize_count += 1
+        self.resize_history.append({
+            'old_capacity': old_capacity,
+            'new_capacity': capacity,
+            'moved': count,
+            'seconds': time.perf_counter() - started,
+        })
+
+    def __iter__(self):
+        """Yield the keys in slot order"""
+        for key in self._keys:
+            if key is not _EMPTY and key is not _DELETED:
+                yield key
+
+    def __contains__(self, key):
+        return self._find(key) >= 0
+
+    def _slots(self):
+        """Yield the index of every live slot"""
+        for index, key in enumerate(self._keys):
+            if key is not _EMPTY and key is not _DELETED:
+                yield index
+
+    # Live views, like dict's: they read the table on each pass and copy nothing
     def keys(self):
-        all_keys = []
-        for i in range(len(self.data_map)):
-            if self.data_map[i] is not None:
-                for j in range(len(self.data_map[i])):
-                    all_keys.append(self.data_map[i][j][0])
-        return all_keys
+        return KeysView(self)
+
+    def values(self):
+        return ValuesView(self)
+
+    def items(self):
+        return ItemsView(self)
+
+    def probe_lengths(self):
+        """Yield how many slots a lookup of each stored key inspects"""
+        mask = self._mask
+        shift = self._shift
+        for index, key in enumerate(self._keys):
+            if key is _EMPTY or key is _DELETED:
+                continue
+            home = ((self._hashes[index] * _FIBONACCI) & _MASK64) >> shift
+            yield ((index - home) & mask) + 1
+
+    def metrics(self):
+        """Return a snapshot of the table's shape and cumulative counters"""
+        histogram = {}
+        for length in self.probe_lengths():
+            histogram[length] = histogram.get(length, 0) + 1
+        return {
+            'count': self.count,
+            'capacity': self.capacity,
+            'tombstones': self.deleted,
+            'load_factor': self.count / self.capacity,
+            'probe_length_histogram': dict(sorted(histogram.items())),
+            'max_probe_length': max(histogram) if histogram else 0,
+            'resize_count': self.resize_count,
+            'resizes': list(self.resize_history),
+            'hashes_computed': self.hashes_computed,
+            'lookups': self.lookups,
+            'probes_per_lookup': self.lookup_probes / self.lookups if self.lookups else 0.0,
+            'inserts': self.inserts,
+            'probes_per_insert': self.insert_probes / self.inserts if self.inserts else 0.0,
+        }
+
+    def reset_counters(self):
+        """Zero the cumulative counters, keeping the table contents"""
+        self.hashes_computed = 0
+        self.lookups = 0
+        self.lookup_probes = 0
+        self.inserts = 0
+        self.insert_probes = 0
+        self.resize_count = 0
+        self.resize_history = []
+
+
+class TableView:
+    __slots__ = ('table',)
+
+    def __init__(self, table):
+        self.table = table
+
+    def __len__(self):
+        return self.table.count
+
+    def __repr__(self):
+        return "%s(%r)" % (type(self).__name__, list(self))
+
+
+class KeysView(TableView):
+    __slots__ = ()
+
+    def __iter__(self):
+        return iter(self.table)
+
+    def __contains__(self, key):
+        return key in self.table
+
+
+class ValuesView(TableView):
+    __slots__ = ()
+
+    def __iter__(self):
+        values = self.table._values
+        for index in self.table._slots():
+            yield values[index]
+
+
+class ItemsView(TableView):
+    __slots__ = ()
+
+    def __iter__(self):
+        keys = self.table._keys
+        values = self.table._values
+        for index in self.table._slots():
+            yield keys[index], values[index]
+
+    def __contains__(self, item):
+        key, value = item
+        index = self.table._find(key)
+        return index >= 0 and self.table._values[index] == value
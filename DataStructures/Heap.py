@@ -1,7 +1,37 @@
-class MaxHeap:
+from DataStructures.Observable import Observable, Inserted, Removed, Swapped, Updated, Reordered
+
+
+class MaxHeap(Observable):
     def __init__(self):
         self.heap = []
 
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Build a heap from any iterable with bottom-up heapify, in O(n)"""
+        heap = cls()
+        heap.heap = list(iterable)
+        heap._heapify()
+        return heap
+
+    def _heapify(self):
+        for index in range(self._parent(len(self.heap) - 1), -1, -1):
+            self._sink_down(index)
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __iter__(self):
+        """Yield the values in heap (array) order, which is not sorted"""
+        return iter(self.heap)
+
+    def __contains__(self, value):
+        return value in self.heap
+
+    def peek(self):
+        if len(self.heap) == 0:
+            return None
+        return self.heap[0]
+
     def _left_child(self, index):
         return 2 * index + 1
 
@@ -13,28 +43,46 @@ class MaxHeap:
 
     def _swap(self, index1, index2):
         self.heap[index1], self.heap[index2] = self.heap[index2], self.heap[index1]
+        if self._observers:
+            self._notify(Swapped(index1, index2))
 
     def insert(self, value):
         self.heap.append(value)
         current = len(self.heap) - 1
+        if self._observers:
+            self._notify(Inserted(current, value))
 
         while current > 0 and self.heap[current] > self.heap[self._parent(current)]:
             self._swap(current, self._parent(current))
             current = self._parent(current)
 
 
+    def push_many(self, values):
+        values = list(values)
+        if len(values) > len(self.heap):
+            # Cheaper to heapify everything again than to sift each value up
+            self.heap.extend(values)
+            self._heapify()
+            if self._observers:
+                self._notify(Reordered())
+        else:
+            for value in values:
+                self.insert(value)
+
     def _sink_down(self, index):
+        heap = self.heap
+        size = len(heap)
         max_index = index
         while True:
-            left_index = self._left_child(index)
-            right_index = self._right_child(index)
+            left_index = 2 * index + 1
+            right_index = left_index + 1
 
-            if (left_index < len(self.heap) and 
-                    self.heap[left_index] > self.heap[max_index]):
+            if (left_index < size and 
+                    heap[left_index] > heap[max_index]):
                 max_index = left_index
 
-            if (right_index < len(self.heap) and 
-                    self.heap[right_index] > self.heap[max_index]):
+            if (right_index < size and 
+                    heap[right_index] > heap[max_index]):
                 max_index = right_index
 
             if max_index != index:
@@ -48,36 +96,189 @@ class MaxHeap:
             return None
 
         if len(self.heap) == 1:
-            return self.heap.pop()
+            max_value = self.heap.pop()
+            if self._observers:
+                self._notify(Removed(0, max_value))
+            return max_value
 
+        # The last value replaces the root, then sinks into place
         max_value = self.heap[0]
         self.heap[0] = self.heap.pop()
+        if self._observers:
+            self._notify(Swapped(0, len(self.heap)))
+            self._notify(Removed(len(self.heap), max_value))
         self._sink_down(0)
 
         return max_value
 
+    def pop_many(self, count):
+        """Remove and return up to count values, largest first"""
+        values = []
+        while len(values) < count and len(self.heap) > 0:
+            values.append(self.remove())
+        return values
+
+    def replace(self, value):
+        """Pop the maximum and push value with a single sift down"""
+        if len(self.heap) == 0:
+            self.insert(value)
+            return None
+        max_value = self.heap[0]
+        self.heap[0] = value
+        if self._observers:
+            self._notify(Updated(0, value))
+        self._sink_down(0)
+        return max_value
+
+
+class IndexedMaxHeap(Observable):
+    """Max heap of (handle, priority) pairs whose priorities can change in place
+
+    Handles are any hashable values chosen by the caller, such as task ids.
+    arity sets the number of children per slot; 4 keeps large heaps shallower.
+    """
+
+    def __init__(self, arity=2):
+        if arity < 2:
+            raise ValueError("arity must be at least 2")
+        self.arity = arity
+        # Parallel slot lists, plus each handle's current slot
+        self.heap = []
+        self.handles = []
+        self.position = {}
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, handle):
+        return handle in self.position
+
+    def __iter__(self):
+        """Yield the (handle, priority) pairs in heap (array) order"""
+        return zip(self.handles, self.heap)
+
+    def priority(self, handle):
+        return self.heap[self.position[handle]]
+
+    def peek(self):
+        if len(self.heap) == 0:
+            return None
+        return self.handles[0], self.heap[0]
+
+    def _swap(self, index1, index2):
+        heap = self.heap
+        handles = self.handles
+        heap[index1], heap[index2] = heap[index2], heap[index1]
+        handles[index1], handles[index2] = handles[index2], handles[index1]
+        self.position[handles[index1]] = index1
+        self.position[handles[index2]] = index2
+        if self._observers:
+            self._notify(Swapped(index1, index2))
+
+    def _sift_up(self, index):
+        heap = self.heap
+        arity = self.arity
+        while index > 0:
+            parent = (index - 1) // arity
+            if not heap[index] > heap[parent]:
+                return
+            self._swap(index, parent)
+            index = parent
+
+    def _sink_down(self, index):
+        heap = self.heap
+        size = len(heap)
+        arity = self.arity
+        while True:
+            first_child = arity * index + 1
+            if first_child >= size:
+                return
+            max_index = index
+            for child in range(first_child, min(first_child + arity, size)):
+                if heap[child] > heap[max_index]:
+                    max_index = child
+            if max_index == index:
+                return
+            self._swap(index, max_index)
+            index = max_index
+
+    def insert(self, handle, priority):
+        if handle in self.position:
+            raise ValueError("handle is already in the heap: %r" % (handle,))
+        index = len(self.heap)
+        self.heap.append(priority)
+        self.handles.append(handle)
+        self.position[handle] = index
+        if self._observers:
+            self._notify(Inserted(index, priority))
+        self._sift_up(index)
+
+    def increase_key(self, handle, priority):
+        index = self.position[handle]
+        if priority < self.heap[index]:
+            raise ValueError("increase_key cannot lower a priority")
+        self.heap[index] = priority
+        if self._observers:
+            self._notify(Updated(index, priority))
+        self._sift_up(index)
+
+    def decrease_key(self, handle, priority):
+        index = self.position[handle]
+        if priority > self.heap[index]:
+            raise ValueError("decrease_key cannot raise a priority")
+        self.heap[index] = priority
+        if self._observers:
+            self._notify(Updated(index, priority))
+        self._sink_down(index)
+
+    def pop(self):
+        """Remove and return the (handle, priority) with the highest priority"""
+        if len(self.heap) == 0:
+            return None
+        handle = self.handles[0]
+        return handle, self.remove(handle)
+
+    def remove(self, handle):
+        """Remove handle from anywhere in the heap and return its priority"""
+        index = self.position[handle]
+        last = len(self.heap) - 1
+        if index != last:
+            self._swap(index, last)
+        priority = self.heap.pop()
+        self.handles.pop()
+        del self.position[handle]
+        if self._observers:
+            self._notify(Removed(last, priority))
+
+        # The value moved into the hole may belong above or below it
+        if index < last:
+            self._sift_up(index)
+            self._sink_down(index)
+        return priority
+
 
+if __name__ == "__main__":
+    myheap = MaxHeap()
+    myheap.insert(95)
+    myheap.insert(75)
+    myheap.insert(80)
+    myheap.insert(55)
+    myheap.insert(60)
+    myheap.insert(50)
+    myheap.insert(65)
 
-myheap = MaxHeap()
-myheap.insert(95)
-myheap.insert(75)
-myheap.insert(80)
-myheap.insert(55)
-myheap.insert(60)
-myheap.insert(50)
-myheap.insert(65)
+    print(myheap.heap)
 
-print(myheap.heap)
 
+    myheap.remove()
 
-myheap.remove()
+    print(myheap.heap)
 
-print(myheap.heap)
 
+    myheap.remove()
 
-myheap.remove()
+    print(myheap.heap)
 
-print(myheap.heap)
 
 
 """
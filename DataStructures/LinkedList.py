@@ -1,16 +1,39 @@
+from DataStructures.Observable import Observable, Inserted, Removed, Updated, Reordered
+from DataStructures.ListSort import merge_runs, merge_sort_steps, SortMerge
+from DataStructures.NodePool import NodePool, NIL
+
+
 class Node:
+    # No per-node __dict__: each element is only a value and its links
+    __slots__ = ('value', 'next')
+
     def __init__(self, value):
         self.value = value
         self.next = None
         
 
-class LinkedList:
+class LinkedList(Observable):
+    # Last node reached by position and its index, so sequential access
+    # continues from there instead of from head
+    _finger = None
+    _finger_index = 0
+
     def __init__(self, value):
         new_node = Node(value)
         self.head = new_node
         self.tail = new_node
         self.length = 1
                 
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        """Yield the values from head to tail"""
+        temp = self.head
+        while temp is not None:
+            yield temp.value
+            temp = temp.next
+
     def append(self, value):
         new_node = Node(value)
         if self.length == 0:
@@ -20,6 +43,8 @@ class LinkedList:
             self.tail.next = new_node
             self.tail = new_node
         self.length += 1
+        if self._observers:
+            self._notify(Inserted(self.length - 1, value))
         return True
 
     def pop(self):
@@ -36,6 +61,9 @@ class LinkedList:
         if self.length == 0:
             self.head = None
             self.tail = None
+        self._finger_removed(self.length)
+        if self._observers:
+            self._notify(Removed(self.length, temp.value))
         return temp
 
     def prepend(self, value):
@@ -47,6 +75,9 @@ class LinkedList:
             new_node.next = self.head
             self.head = new_node
         self.length += 1
+        self._finger_inserted(0)
+        if self._observers:
+            self._notify(Inserted(0, value))
         return True
 
     def pop_first(self):
@@ -58,20 +89,47 @@ class LinkedList:
         self.length -= 1
         if self.length == 0:
             self.tail = None
+        self._finger_removed(0)
+        if self._observers:
+            self._notify(Removed(0, temp.value))
         return temp
 
     def get(self, index):
         if index < 0 or index >= self.length:
             return None
-        temp = self.head
-        for _ in range(index):
+        return self._walk(index)
+
+    def _walk(self, index):
+        """Return the node at a valid index, starting from the finger when it is not past it"""
+        if self._finger is not None and self._finger_index <= index:
+            temp = self._finger
+            start = self._finger_index
+        else:
+            temp = self.head
+            start = 0
+        for _ in range(index - start):
             temp = temp.next
+        self._finger = temp
+        self._finger_index = index
         return temp
+
+    def _finger_inserted(self, index):
+        if self._finger is not None and self._finger_index >= index:
+            self._finger_index += 1
+
+    def _finger_removed(self, index):
+        if self._finger is not None:
+            if self._finger_index == index:
+                self._finger = None
+            elif self._finger_index > index:
+                self._finger_index -= 1
         
     def set_value(self, index, value):
         temp = self.get(index)
         if temp:
             temp.value = value
+            if self._observers:
+                self._notify(Updated(index, value))
             return True
         return False
     
@@ -82,12 +140,25 @@ class LinkedList:
             return self.prepend(value)
         if index == self.length:
             return self.append(value)
+        self._link(self._walk(index - 1), index, value)
+        return True
+
+    def _link(self, before, index, value):
+        """Add value after node before (None for the head) as position index; return its node"""
+        if before is None:
+            self.prepend(value)
+            return self.head
+        if before is self.tail:
+            self.append(value)
+            return self.tail
         new_node = Node(value)
-        temp = self.get(index - 1)
-        new_node.next = temp.next
-        temp.next = new_node
-        self.length += 1   
-        return True  
+        new_node.next = before.next
+        before.next = new_node
+        self.length += 1
+        self._finger_inserted(index)
+        if self._observers:
+            self._notify(Inserted(index, value))
+        return new_node
 
     def remove(self, index):
         if index < 0 or index >= self.length:
@@ -96,11 +167,22 @@ class LinkedList:
             return self.pop_first()
         if index == self.length - 1:
             return self.pop()
-        pre = self.get(index - 1)
-        temp = pre.next
-        pre.next = temp.next
+        return self._unlink(self._walk(index - 1), index)
+
+    def _unlink(self, before, index):
+        """Remove the node after before (None for the head), which is at index"""
+        if before is None:
+            return self.pop_first()
+        temp = before.next
+        before.next = temp.next
         temp.next = None
+        if temp is self.tail:
+            # The predecessor is known, so no walk is needed to pop the tail
+            self.tail = before
         self.length -= 1
+        self._finger_removed(index)
+        if self._observers:
+            self._notify(Removed(index, temp.value))
         return temp
 
     def reverse(self):
@@ -116,3 +198,297 @@ class LinkedList:
             temp.next = before
             before = temp
             temp = after
+        self._finger = None
+        if self._observers:
+            self._notify(Reordered())
+
+    # Sorting
+    def sort(self, key=None):
+        """Sort the nodes in place with a bottom-up merge sort, O(n log n), stable"""
+        for _ in merge_sort_steps(self, key, False):
+            pass
+        self._relinked()
+        if self._observers:
+            self._notify(Reordered())
+
+    def sort_steps(self, key=None):
+        """Sort like sort(), yielding a SortSplit or SortMerge at every step
+
+        The list is whole between steps, and observers get a Reordered after
+        each merge, so a renderer can show the sort as it runs.
+        """
+        try:
+            for step in merge_sort_steps(self, key, False):
+                if isinstance(step, SortMerge):
+                    self._merged(step.start, step.length)
+                    if self._observers:
+                        self._notify(Reordered())
+                yield step
+        finally:
+            self._relinked()
+
+    def sorted_insert(self, value, key=None):
+        """Insert value into an already sorted list, after any equal values"""
+        value_key = value if key is None else key(value)
+        before = None
+        temp = self.head
+        index = 0
+        while temp is not None and (temp.value if key is None else key(temp.value)) <= value_key:
+            before = temp
+            temp = temp.next
+            index += 1
+        self._link(before, index, value)
+        return True
+
+    def merge(self, other, key=None):
+        """Merge the nodes of another sorted list into this sorted one; other ends up empty"""
+        if other is self:
+            raise ValueError("cannot merge a list with itself")
+        if not isinstance(other, LinkedList):
+            raise TypeError("can only merge another LinkedList")
+        if other.length == 0:
+            return
+        if self.length == 0:
+            self.head = other.head
+            self.tail = other.tail
+        else:
+            self.head, self.tail = merge_runs(self.head, other.head, key, False)
+        self.length += other.length
+        other.head = None
+        other.tail = None
+        other.length = 0
+        self._relinked()
+        other._relinked()
+        if self._observers:
+            self._notify(Reordered())
+        if other._observers:
+            other._notify(Reordered())
+
+    def _relinked(self):
+        """Called after nodes were relinked wholesale"""
+        self._finger = None
+
+    def _merged(self, start, length):
+        """Called after sort_steps relinked the length nodes from index start"""
+        self._finger = None
+
+    def cursor(self, index=0):
+        return Cursor(self, index)
+
+
+class Cursor:
+    """A position in a LinkedList that remembers where it is
+
+    move_to continues forward from the cursor when it can, and insert and
+    remove act at the cursor in O(1). Changing the list other than through
+    this cursor invalidates it, as with an iterator. index may equal the
+    list's length, which is the position past the tail.
+    """
+
+    def __init__(self, linked_list, index=0):
+        self.list = linked_list
+        self.index = 0
+        self.node = linked_list.head
+        self.prev = None
+        self.move_to(index)
+
+    @property
+    def value(self):
+        return self.node.value if self.node is not None else None
+
+    def move_to(self, index):
+        if index < 0 or index > self.list.length:
+            raise IndexError("cursor index out of range")
+        if index == self.list.length:
+            # Past the end; the tail is the predecessor
+            self.index = index
+            self.node = None
+            self.prev = self.list.tail
+            return
+        if index < self.index or (self.node is None and self.prev is None):
+            self.index = 0
+            self.node = self.list.head
+            self.prev = None
+        while self.index < index:
+            self.prev = self.node
+            self.node = self.node.next
+            self.index += 1
+
+    def advance(self):
+        """Step to the next position; False once past the end"""
+        if self.index >= self.list.length:
+            return False
+        self.move_to(self.index + 1)
+        return True
+
+    def insert(self, value):
+        """Insert value at the cursor; the cursor then points at it"""
+        self.node = self.list._link(self.prev, self.index, value)
+
+    def remove(self):
+        """Remove and return the node at the cursor, which moves on to its successor"""
+        if self.node is None:
+            return None
+        removed = self.list._unlink(self.prev, self.index)
+        self.node = self.prev.next if self.prev is not None else self.list.head
+        return removed
+
+
+class PooledLinkedList(Observable):
+    """LinkedList whose nodes live in a NodePool and link by index
+
+    head, tail and get return NodeViews; removals return a detached Node.
+    """
+
+    def __init__(self, value, pool=None):
+        self.pool = pool if pool is not None else NodePool()
+        index = self.pool.alloc(value)
+        self._head = index
+        self._tail = index
+        self.length = 1
+
+    @property
+    def head(self):
+        return self.pool.view(self._head)
+
+    @property
+    def tail(self):
+        return self.pool.view(self._tail)
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        values = self.pool.values
+        next_index = self.pool.next
+        temp = self._head
+        while temp != NIL:
+            yield values[temp]
+            temp = next_index[temp]
+
+    def _release(self, index):
+        return Node(self.pool.release(index))
+
+    def append(self, value):
+        index = self.pool.alloc(value)
+        if self.length == 0:
+            self._head = index
+        else:
+            self.pool.next[self._tail] = index
+        self._tail = index
+        self.length += 1
+        if self._observers:
+            self._notify(Inserted(self.length - 1, value))
+        return True
+
+    def pop(self):
+        if self.length == 0:
+            return None
+        next_index = self.pool.next
+        temp = self._head
+        pre = self._head
+        while next_index[temp] != NIL:
+            pre = temp
+            temp = next_index[temp]
+        self._tail = pre
+        next_index[pre] = NIL
+        self.length -= 1
+        if self.length == 0:
+            self._head = NIL
+            self._tail = NIL
+        node = self._release(temp)
+        if self._observers:
+            self._notify(Removed(self.length, node.value))
+        return node
+
+    def prepend(self, value):
+        index = self.pool.alloc(value)
+        if self.length == 0:
+            self._tail = index
+        else:
+            self.pool.next[index] = self._head
+        self._head = index
+        self.length += 1
+        if self._observers:
+            self._notify(Inserted(0, value))
+        return True
+
+    def pop_first(self):
+        if self.length == 0:
+            return None
+        temp = self._head
+        self._head = self.pool.next[temp]
+        self.length -= 1
+        if self.length == 0:
+            self._tail = NIL
+        node = self._release(temp)
+        if self._observers:
+            self._notify(Removed(0, node.value))
+        return node
+
+    def _index_at(self, index):
+        next_index = self.pool.next
+        temp = self._head
+        for _ in range(index):
+            temp = next_index[temp]
+        return temp
+
+    def get(self, index):
+        if index < 0 or index >= self.length:
+            return None
+        return self.pool.view(self._index_at(index))
+
+    def set_value(self, index, value):
+        if index < 0 or index >= self.length:
+            return False
+        self.pool.values[self._index_at(index)] = value
+        if self._observers:
+            self._notify(Updated(index, value))
+        return True
+
+    def insert(self, index, value):
+        if index < 0 or index > self.length:
+            return False
+        if index == 0:
+            return self.prepend(value)
+        if index == self.length:
+            return self.append(value)
+        new_index = self.pool.alloc(value)
+        temp = self._index_at(index - 1)
+        self.pool.next[new_index] = self.pool.next[temp]
+        self.pool.next[temp] = new_index
+        self.length += 1
+        if self._observers:
+            self._notify(Inserted(index, value))
+        return True
+
+    def remove(self, index):
+        if index < 0 or index >= self.length:
+            return None
+        if index == 0:
+            return self.pop_first()
+        if index == self.length - 1:
+            return self.pop()
+        pre = self._index_at(index - 1)
+        temp = self.pool.next[pre]
+        self.pool.next[pre] = self.pool.next[temp]
+        self.length -= 1
+        node = self._release(temp)
+        if self._observers:
+            self._notify(Removed(index, node.value))
+        return node
+
+    def reverse(self):
+        if self.length == 0:
+            return None
+        next_index = self.pool.next
+        temp = self._head
+        self._head, self._tail = self._tail, self._head
+        before = NIL
+        for _ in range(self.length):
+            after = next_index[temp]
+            next_index[temp] = before
+            before = temp
+            temp = after
+        if self._observers:
+            self._notify(Reordered())
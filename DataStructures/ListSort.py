@@ -0,0 +1,106 @@
+from collections import namedtuple
+
+# Steps yielded by merge_sort_steps. start is the index of the first node of
+# the left run; the list is fully linked from head to tail at every step.
+SortSplit = namedtuple('SortSplit', 'start left right')
+SortMerge = namedtuple('SortMerge', 'start length')
+
+
+def merge_runs(a, b, key=None, doubly=False):
+    """Stably merge two sorted runs of nodes, each ending in None
+
+    Only next (and prev when doubly) pointers change; no node is allocated.
+    Returns the (head, tail) of the merged run.
+    """
+    if key is None:
+        take_b = b.value < a.value
+    else:
+        take_b = key(b.value) < key(a.value)
+    if take_b:
+        head = b
+        b = b.next
+    else:
+        head = a
+        a = a.next
+    if doubly:
+        head.prev = None
+    tail = head
+
+    while a is not None and b is not None:
+        if key is None:
+            take_b = b.value < a.value
+        else:
+            take_b = key(b.value) < key(a.value)
+        if take_b:
+            tail.next = b
+            if doubly:
+                b.prev = tail
+            tail = b
+            b = b.next
+        else:
+            tail.next = a
+            if doubly:
+                a.prev = tail
+            tail = a
+            a = a.next
+
+    # Append whichever run is left over and find its end
+    rest = a if a is not None else b
+    tail.next = rest
+    if doubly and rest is not None:
+        rest.prev = tail
+    while tail.next is not None:
+        tail = tail.next
+    return head, tail
+
+
+def merge_sort_steps(linked_list, key=None, doubly=False):
+    """Bottom-up merge sort of linked_list's nodes, relinked in place
+
+    Runs of width 1, 2, 4, ... are merged pairwise from the head. Yields a
+    SortSplit before each merge and a SortMerge after it.
+    """
+    length = linked_list.length
+    width = 1
+    while width < length:
+        before = None  # Last node of the part already merged in this pass
+        current = linked_list.head
+        start = 0
+        while current is not None:
+            left_end = current
+            left_length = 1
+            while left_length < width and left_end.next is not None:
+                left_end = left_end.next
+                left_length += 1
+            right = left_end.next
+            if right is None:
+                # A lone run at the end is already in place
+                break
+            right_end = right
+            right_length = 1
+            while right_length < width and right_end.next is not None:
+                right_end = right_end.next
+                right_length += 1
+            rest = right_end.next
+            yield SortSplit(start, left_length, right_length)
+
+            left_end.next = None
+            right_end.next = None
+            head, tail = merge_runs(current, right, key, doubly)
+            if before is None:
+                linked_list.head = head
+            else:
+                before.next = head
+                if doubly:
+                    head.prev = before
+            tail.next = rest
+            if rest is None:
+                linked_list.tail = tail
+            elif doubly:
+                rest.prev = tail
+            yield SortMerge(start, left_length + right_length)
+
+            before = tail
+            current = rest
+            start += left_length + right_length
+        width *= 2
@@ -0,0 +1,103 @@
+import sys
+from array import array
+
+# Index that stands for a missing link (None in the object-based nodes)
+NIL = -1
+
+
+class NodePool:
+    """Arena of list nodes kept in parallel arrays instead of one object each
+
+    A node is an index: its value is values[i] and its links are next[i] and
+    prev[i] (NIL when absent). Released slots are chained through next into
+    a free list and handed out again by alloc. prev is only kept when the
+    pool is created with doubly=True. Several structures may share one pool.
+    """
+
+    def __init__(self, doubly=False):
+        self.values = []
+        self.next = array('l')
+        self.prev = array('l') if doubly else None
+        self.free = NIL
+        self.live = 0
+
+    def __len__(self):
+        return self.live
+
+    def alloc(self, value):
+        index = self.free
+        if index != NIL:
+            self.free = self.next[index]
+            self.values[index] = value
+            self.next[index] = NIL
+            if self.prev is not None:
+                self.prev[index] = NIL
+        else:
+            index = len(self.values)
+            self.values.append(value)
+            self.next.append(NIL)
+            if self.prev is not None:
+                self.prev.append(NIL)
+        self.live += 1
+        return index
+
+    def release(self, index):
+        """Return the node's slot to the free list and hand back its value"""
+        value = self.values[index]
+        self.values[index] = None
+        self.next[index] = self.free
+        self.free = index
+        self.live -= 1
+        return value
+
+    def view(self, index):
+        """NodeView for index, or None for NIL"""
+        if index == NIL:
+            return None
+        return NodeView(self, index)
+
+    def nbytes(self):
+        """Bytes held by the pool's own arrays, not counting the values"""
+        size = sys.getsizeof(self.values) + sys.getsizeof(self.next)
+        if self.prev is not None:
+            size += sys.getsizeof(self.prev)
+        return size
+
+
+class NodeView:
+    """Node-like handle on a pooled node, with value, next and prev attributes
+
+    Views are created on demand, so compare them with == rather than is.
+    """
+
+    __slots__ = ('pool', 'index')
+
+    def __init__(self, pool, index):
+        self.pool = pool
+        self.index = index
+
+    @property
+    def value(self):
+        return self.pool.values[self.index]
+
+    @value.setter
+    def value(self, value):
+        self.pool.values[self.index] = value
+
+    @property
+    def next(self):
+        return self.pool.view(self.pool.next[self.index])
+
+    @property
+    def prev(self):
+        return self.pool.view(self.pool.prev[self.index])
+
+    def __eq__(self, other):
+        return (isinstance(other, NodeView) and
+                self.pool is other.pool and self.index == other.index)
+
+    def __hash__(self):
+        return hash((id(self.pool), self.index))
+
+    def __repr__(self):
+        return "NodeView(%r)" % (self.value,)
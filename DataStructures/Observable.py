@@ -0,0 +1,38 @@
+from collections import namedtuple
+
+# Change records passed to observers. index is the position in traversal
+# order (head first, top of stack first); it is None for structures that
+# have no positions, such as BinarySearchTree.
+Inserted = namedtuple('Inserted', 'index value')
+Removed = namedtuple('Removed', 'index value')
+Updated = namedtuple('Updated', 'index value')
+Swapped = namedtuple('Swapped', 'i j')
+Reordered = namedtuple('Reordered', '')
+ItemSet = namedtuple('ItemSet', 'key value')
+ItemRemoved = namedtuple('ItemRemoved', 'key')
+VertexAdded = namedtuple('VertexAdded', 'vertex')
+VertexRemoved = namedtuple('VertexRemoved', 'vertex')
+EdgeAdded = namedtuple('EdgeAdded', 'u v')
+EdgeRemoved = namedtuple('EdgeRemoved', 'u v')
+
+
+class Observable:
+    # Stays None until the first subscribe, so unobserved structures only
+    # pay for one attribute check per mutation
+    _observers = None
+
+    def subscribe(self, callback):
+        """Call callback(change) after every mutation"""
+        if self._observers is None:
+            self._observers = []
+        self._observers.append(callback)
+
+    def unsubscribe(self, callback):
+        if self._observers and callback in self._observers:
+            self._observers.remove(callback)
+            if not self._observers:
+                self._observers = None
+
+    def _notify(self, change):
+        for callback in self._observers:
+            callback(change)
@@ -1,16 +1,33 @@
+from array import array
+from DataStructures.Observable import Observable, Inserted, Removed
+from DataStructures.NodePool import NodePool, NIL
+
+
 class Node:
+    __slots__ = ('value', 'next')
+
     def __init__(self, value):
         self.value = value
         self.next = None
         
 
-class Queue:
+class Queue(Observable):
     def __init__(self, value):
         new_node = Node(value)
         self.first = new_node
         self.last = new_node
         self.length = 1
 
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        """Yield the values from first (next out) to last"""
+        temp = self.first
+        while temp is not None:
+            yield temp.value
+            temp = temp.next
+
     def print_queue(self):
         temp = self.first
         while temp is not None:
@@ -26,6 +43,8 @@ class Queue:
             self.last.next = new_node
             self.last = new_node
         self.length += 1
+        if self._observers:
+            self._notify(Inserted(self.length - 1, value))
         return True
 
     def dequeue(self):
@@ -39,4 +58,199 @@ class Queue:
             self.first = self.first.next
             temp.next = None
         self.length -= 1
+        if self._observers:
+            self._notify(Removed(0, temp.value))
         return temp
+
+
+class PooledQueue(Observable):
+    """Queue whose nodes live in a NodePool and link by index
+
+    first and last return NodeViews; dequeue returns a detached Node.
+    """
+
+    def __init__(self, value, pool=None):
+        self.pool = pool if pool is not None else NodePool()
+        index = self.pool.alloc(value)
+        self._first = index
+        self._last = index
+        self.length = 1
+
+    @property
+    def first(self):
+        return self.pool.view(self._first)
+
+    @property
+    def last(self):
+        return self.pool.view(self._last)
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        values = self.pool.values
+        next_index = self.pool.next
+        temp = self._first
+        while temp != NIL:
+            yield values[temp]
+            temp = next_index[temp]
+
+    def print_queue(self):
+        temp = self._first
+        while temp != NIL:
+            print(self.pool.values[temp])
+            temp = self.pool.next[temp]
+
+    def enqueue(self, value):
+        index = self.pool.alloc(value)
+        if self._first == NIL:
+            self._first = index
+        else:
+            self.pool.next[self._last] = index
+        self._last = index
+        self.length += 1
+        if self._observers:
+            self._notify(Inserted(self.length - 1, value))
+        return True
+
+    def dequeue(self):
+        if self.length == 0:
+            return None
+        temp = self._first
+        if self.length == 1:
+            self._first = NIL
+            self._last = NIL
+        else:
+            self._first = self.pool.next[temp]
+        self.length -= 1
+        node = Node(self.pool.release(temp))
+        if self._observers:
+            self._notify(Removed(0, node.value))
+        return node
+
+
+class RingBufferQueue(Observable):
+    """Queue on a growable circular buffer, without a node per stored element
+
+    With a typecode such as 'i' or 'd' the slots are a typed array, which
+    stores numbers unboxed. Like Queue it starts with one value and dequeue
+    returns a detached Node; the batch calls enqueue_many and dequeue_many
+    take and return plain values.
+    """
+
+    def __init__(self, value, capacity=8, typecode=None):
+        self.typecode = typecode
+        size = 8
+        while size < capacity:
+            size *= 2
+        self._buffer = self._blank(size)
+        self._mask = size - 1
+        self._head = 0
+        self._buffer[0] = value
+        self.length = 1
+
+    def _blank(self, size):
+        if self.typecode is None:
+            return [None] * size
+        return array(self.typecode, [0]) * size
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        """Yield the values from the front (next out) to the back"""
+        buffer = self._buffer
+        for i in range(self.length):
+            yield buffer[(self._head + i) & self._mask]
+
+    def __reversed__(self):
+        buffer = self._buffer
+        for i in range(self.length - 1, -1, -1):
+            yield buffer[(self._head + i) & self._mask]
+
+    def capacity(self):
+        return len(self._buffer)
+
+    def print_queue(self):
+        for i in range(self.length):
+            print(self._buffer[(self._head + i) & self._mask])
+
+    def _grow(self, needed):
+        """Reallocate so at least needed values fit, unwrapping the ring to start at slot 0"""
+        size = len(self._buffer)
+        while size < needed:
+            size *= 2
+        buffer = self._buffer
+        head = self._head
+        if head + self.length <= len(buffer):
+            values = buffer[head:head + self.length]
+        else:
+            values = buffer[head:] + buffer[:(head + self.length) & self._mask]
+        self._buffer = values + self._blank(size - self.length)
+        self._mask = size - 1
+        self._head = 0
+
+    def enqueue(self, value):
+        if self.length == len(self._buffer):
+            self._grow(self.length + 1)
+        self._buffer[(self._head + self.length) & self._mask] = value
+        self.length += 1
+        if self._observers:
+            self._notify(Inserted(self.length - 1, value))
+        return True
+
+    def dequeue(self):
+        if self.length == 0:
+            return None
+        head = self._head
+        value = self._buffer[head]
+        if self.typecode is None:
+            self._buffer[head] = None  # Drop the reference so the value can be freed
+        self._head = (head + 1) & self._mask
+        self.length -= 1
+        if self._observers:
+            self._notify(Removed(0, value))
+        return Node(value)
+
+    def peek(self):
+        if self.length == 0:
+            return None
+        return self._buffer[self._head]
+
+    # Batches: at most two slice copies, one on each side of the wrap point
+    def enqueue_many(self, values):
+        if self._observers:
+            for value in values:
+                self.enqueue(value)
+            return
+        if self.typecode is None:
+            values = list(values)
+        else:
+            values = array(self.typecode, values)
+        count = len(values)
+        if self.length + count > len(self._buffer):
+            self._grow(self.length + count)
+        buffer = self._buffer
+        start = (self._head + self.length) & self._mask
+        first = min(count, len(buffer) - start)
+        buffer[start:start + first] = values[:first]
+        buffer[:count - first] = values[first:]
+        self.length += count
+
+    def dequeue_many(self, count):
+        """Remove and return up to count values, oldest first"""
+        if self._observers:
+            return [self.dequeue().value for _ in range(min(count, self.length))]
+        count = min(count, self.length)
+        if count <= 0:
+            return []
+        buffer = self._buffer
+        head = self._head
+        first = min(count, len(buffer) - head)
+        values = buffer[head:head + first] + buffer[:count - first]
+        if self.typecode is None:
+            buffer[head:head + first] = [None] * first
+            buffer[:count - first] = [None] * (count - first)
+        self._head = (head + count) & self._mask
+        self.length -= count
+        return list(values)
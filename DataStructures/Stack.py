@@ -1,15 +1,32 @@
+from array import array
+from DataStructures.Observable import Observable, Inserted, Removed
+from DataStructures.NodePool import NodePool, NIL
+
+
 class Node:
+    __slots__ = ('value', 'next')
+
     def __init__(self, value):
         self.value = value
         self.next = None
         
 
-class Stack:
+class Stack(Observable):
     def __init__(self, value):
         new_node = Node(value)
         self.top = new_node
         self.height = 1
 
+    def __len__(self):
+        return self.height
+
+    def __iter__(self):
+        """Yield the values from the top down"""
+        temp = self.top
+        while temp is not None:
+            yield temp.value
+            temp = temp.next
+
     def print_stack(self):
         temp = self.top
         while temp is not None:
@@ -24,6 +41,8 @@ class Stack:
             new_node.next = self.top
             self.top = new_node
         self.height += 1
+        if self._observers:
+            self._notify(Inserted(0, value))
         return True
 
     def pop(self):
@@ -33,5 +52,134 @@ class Stack:
         self.top = self.top.next
         temp.next = None
         self.height -= 1
+        if self._observers:
+            self._notify(Removed(0, temp.value))
         return temp
-    
\ No newline at end of file
+    
+
+
+class PooledStack(Observable):
+    """Stack whose nodes live in a NodePool and link by index
+
+    top returns a NodeView; pop returns a detached Node.
+    """
+
+    def __init__(self, value, pool=None):
+        self.pool = pool if pool is not None else NodePool()
+        self._top = self.pool.alloc(value)
+        self.height = 1
+
+    @property
+    def top(self):
+        return self.pool.view(self._top)
+
+    def __len__(self):
+        return self.height
+
+    def __iter__(self):
+        values = self.pool.values
+        next_index = self.pool.next
+        temp = self._top
+        while temp != NIL:
+            yield values[temp]
+            temp = next_index[temp]
+
+    def print_stack(self):
+        temp = self._top
+        while temp != NIL:
+            print(self.pool.values[temp])
+            temp = self.pool.next[temp]
+
+    def push(self, value):
+        index = self.pool.alloc(value)
+        if self.height > 0:
+            self.pool.next[index] = self._top
+        self._top = index
+        self.height += 1
+        if self._observers:
+            self._notify(Inserted(0, value))
+        return True
+
+    def pop(self):
+        if self.height == 0:
+            return None
+        temp = self._top
+        self._top = self.pool.next[temp]
+        self.height -= 1
+        node = Node(self.pool.release(temp))
+        if self._observers:
+            self._notify(Removed(0, node.value))
+        return node
+
+
+class ArrayStack(Observable):
+    """Stack on contiguous storage, top at the end; pop returns the value itself
+
+    With a typecode such as 'i' or 'd' the values live unboxed in a typed array.
+    """
+
+    def __init__(self, values=(), typecode=None):
+        self.typecode = typecode
+        if typecode is None:
+            self.items = list(values)
+        else:
+            self.items = array(typecode, values)
+
+    def __len__(self):
+        return len(self.items)
+
+    @property
+    def height(self):
+        return len(self.items)
+
+    def __iter__(self):
+        """Yield the values from the top down"""
+        return reversed(self.items)
+
+    def __reversed__(self):
+        return iter(self.items)
+
+    def __contains__(self, value):
+        return value in self.items
+
+    def print_stack(self):
+        for value in reversed(self.items):
+            print(value)
+
+    def push(self, value):
+        self.items.append(value)
+        if self._observers:
+            self._notify(Inserted(0, value))
+        return True
+
+    def pop(self):
+        if not self.items:
+            return None
+        value = self.items.pop()
+        if self._observers:
+            self._notify(Removed(0, value))
+        return value
+
+    def peek(self):
+        if not self.items:
+            return None
+        return self.items[-1]
+
+    def push_many(self, values):
+        if self._observers:
+            for value in values:
+                self.push(value)
+            return
+        self.items.extend(values)
+
+    def pop_many(self, count):
+        """Remove and return up to count values, top first"""
+        if self._observers:
+            return [self.pop() for _ in range(min(count, len(self.items)))]
+        count = min(count, len(self.items))
+        if count <= 0:
+            return []
+        values = self.items[-count:]
+        del self.items[-count:]
+        values.reverse()
+        return list(values)
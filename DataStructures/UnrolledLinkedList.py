@@ -0,0 +1,287 @@
+from DataStructures.LinkedList import LinkedList, Node
+from DataStructures.Observable import Inserted, Removed, Reordered
+
+
+class UnrolledLinkedList(LinkedList):
+    """LinkedList with a block index over its nodes for fast positional access
+
+    The nodes stay an ordinary head/next chain, so anything that walks a
+    LinkedList (the visualizer included) works unchanged. Alongside it the
+    nodes are also kept in blocks of at most block_size, and _tree is a
+    Fenwick tree over the block lengths. Finding position i descends the
+    tree in O(log n), and an insert or remove inside a block updates it in
+    O(log n) too; only a block split or merge rebuilds it. pop is O(1)
+    because the tail's predecessor sits next to it in the blocks.
+
+    block_size follows the square root of the length, starting from the
+    given size, so a list of any length keeps short blocks and few of them.
+    """
+
+    def __init__(self, value, block_size=64):
+        super().__init__(value)
+        self.min_block_size = max(2, block_size)
+        self.block_size = self.min_block_size
+        self._blocks = [[self.head]]
+        self._reindex()
+
+    def __reversed__(self):
+        """Yield the values from tail to head, read backwards off the blocks"""
+        for nodes in reversed(self._blocks):
+            for i in range(len(nodes) - 1, -1, -1):
+                yield nodes[i].value
+
+    # Block index upkeep
+    def _reindex(self):
+        """Rebuild the Fenwick tree over the block lengths in O(blocks)"""
+        tree = [0]
+        tree.extend([len(nodes) for nodes in self._blocks])
+        size = len(tree)
+        for i in range(1, size):
+            parent = i + (i & -i)
+            if parent < size:
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _resize(self, block, delta):
+        """Record that block gained (or lost) delta nodes"""
+        tree = self._tree
+        i = block + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _locate(self, index):
+        """Return (block, offset) of the node at index"""
+        tree = self._tree
+        size = len(tree)
+        block = 0
+        step = 1 << ((size - 1).bit_length() - 1)
+        while step:
+            following = block + step
+            if following < size and tree[following] <= index:
+                block = following
+                index -= tree[following]
+            step >>= 1
+        return block, index
+
+    def _previous(self, block, offset):
+        """Node just before position (block, offset), or None at the head"""
+        if offset > 0:
+            return self._blocks[block][offset - 1]
+        if block > 0:
+            return self._blocks[block - 1][-1]
+        return None
+
+    def _split(self, block):
+        """Halve a block that has grown past block_size; True if it did"""
+        nodes = self._blocks[block]
+        if len(nodes) <= self.block_size:
+            return False
+        half = len(nodes) // 2
+        self._blocks[block:block + 1] = [nodes[:half], nodes[half:]]
+        return True
+
+    def _shrink(self, block):
+        """Drop an emptied block, or merge a sparse one into a neighbour; True if it did"""
+        blocks = self._blocks
+        if not blocks[block]:
+            del blocks[block]
+            return True
+        if block + 1 < len(blocks) and len(blocks[block]) + len(blocks[block + 1]) <= self.block_size // 2:
+            blocks[block].extend(blocks.pop(block + 1))
+            return True
+        if block > 0 and len(blocks[block - 1]) + len(blocks[block]) <= self.block_size // 2:
+            blocks[block - 1].extend(blocks.pop(block))
+            return True
+        return False
+
+    def _rebalance(self):
+        """Re-block once block_size strays too far from the square root of the length
+
+        Each re-blocking is O(n) but needs the length to quadruple (or drop
+        to a sixteenth) since the last one, so it is O(1) amortized.
+        """
+        size = self.block_size
+        if self.length > size * size * 4:
+            self.block_size = size * 2
+        elif size > self.min_block_size and self.length * 16 < size * size:
+            self.block_size = max(self.min_block_size, size // 2)
+        else:
+            return
+        self._relinked()
+
+    # LinkedList interface
+    def append(self, value):
+        new_node = Node(value)
+        if self.length == 0:
+            self.head = new_node
+            self.tail = new_node
+            self._blocks = [[new_node]]
+            self._reindex()
+        else:
+            self.tail.next = new_node
+            self.tail = new_node
+            if len(self._blocks[-1]) < self.block_size:
+                self._blocks[-1].append(new_node)
+                self._resize(len(self._blocks) - 1, 1)
+            else:
+                self._blocks.append([new_node])
+                self._reindex()
+        self.length += 1
+        self._rebalance()
+        if self._observers:
+            self._notify(Inserted(self.length - 1, value))
+        return True
+
+    def pop(self):
+        if self.length == 0:
+            return None
+        temp = self._blocks[-1].pop()
+        if not self._blocks[-1] and len(self._blocks) > 1:
+            # Fenwick nodes only cover blocks at or before their own, so the
+            # last one can go without touching the rest
+            self._blocks.pop()
+            self._tree.pop()
+        else:
+            self._resize(len(self._blocks) - 1, -1)
+        self.length -= 1
+        if self.length == 0:
+            self.head = None
+            self.tail = None
+        else:
+            self.tail = self._blocks[-1][-1]
+            self.tail.next = None
+        self._rebalance()
+        if self._observers:
+            self._notify(Removed(self.length, temp.value))
+        return temp
+
+    def prepend(self, value):
+        if self.length == 0:
+            return self.append(value)
+        new_node = Node(value)
+        new_node.next = self.head
+        self.head = new_node
+        self._blocks[0].insert(0, new_node)
+        if self._split(0):
+            self._reindex()
+        else:
+            self._resize(0, 1)
+        self.length += 1
+        self._rebalance()
+        if self._observers:
+            self._notify(Inserted(0, value))
+        return True
+
+    def pop_first(self):
+        if self.length == 0:
+            return None
+        return self.remove(0)
+
+    def get(self, index):
+        if index < 0 or index >= self.length:
+            return None
+        block, offset = self._locate(index)
+        return self._blocks[block][offset]
+
+    def insert(self, index, value):
+        if index < 0 or index > self.length:
+            return False
+        if index == 0:
+            return self.prepend(value)
+        if index == self.length:
+            return self.append(value)
+        block, offset = self._locate(index)
+        before = self._previous(block, offset)
+        new_node = Node(value)
+        new_node.next = before.next
+        before.next = new_node
+        self._blocks[block].insert(offset, new_node)
+        if self._split(block):
+            self._reindex()
+        else:
+            self._resize(block, 1)
+        self.length += 1
+        self._rebalance()
+        if self._observers:
+            self._notify(Inserted(index, value))
+        return True
+
+    def remove(self, index):
+        if index < 0 or index >= self.length:
+            return None
+        if index == self.length - 1:
+            return self.pop()
+        block, offset = self._locate(index)
+        before = self._previous(block, offset)
+        temp = self._blocks[block].pop(offset)
+        if before is None:
+            self.head = temp.next
+        else:
+            before.next = temp.next
+        temp.next = None
+        if self._shrink(block):
+            self._reindex()
+        else:
+            self._resize(block, -1)
+        self.length -= 1
+        self._rebalance()
+        if self._observers:
+            self._notify(Removed(index, temp.value))
+        return temp
+
+    def _relinked(self):
+        """Rebuild the blocks from the chain after a sort or merge relinked it"""
+        nodes = []
+        temp = self.head
+        while temp is not None:
+            nodes.append(temp)
+            temp = temp.next
+        size = self.block_size
+        self._blocks = [nodes[i:i + size] for i in range(0, len(nodes), size)] or [[]]
+        self._reindex()
+
+    def _merged(self, start, length):
+        """File a run that sort_steps just merged back into the slots it covers
+
+        The run keeps its positions, so every block keeps its length and only
+        the node references change: O(length + log n) per merge.
+        """
+        super()._merged(start, length)
+        blocks = self._blocks
+        block, offset = self._locate(start)
+        before = self._previous(block, offset)
+        temp = self.head if before is None else before.next
+        for _ in range(length):
+            nodes = blocks[block]
+            nodes[offset] = temp
+            temp = temp.next
+            offset += 1
+            if offset == len(nodes):
+                block += 1
+                offset = 0
+
+    # Cursor edits go through the block-aware insert and remove
+    def _link(self, before, index, value):
+        self.insert(index, value)
+        return self.get(index)
+
+    def _unlink(self, before, index):
+        return self.remove(index)
+
+    def reverse(self):
+        if self.length == 0:
+            return None
+        self._blocks.reverse()
+        for nodes in self._blocks:
+            nodes.reverse()
+        self.head, self.tail = self.tail, self.head
+        for nodes in self._blocks:
+            for i in range(len(nodes) - 1):
+                nodes[i].next = nodes[i + 1]
+        for i in range(len(self._blocks) - 1):
+            self._blocks[i][-1].next = self._blocks[i + 1][0]
+        self.tail.next = None
+        self._reindex()
+        if self._observers:
+            self._notify(Reordered())
@@ -0,0 +1,134 @@
+def linear(t):
+    return t
+
+
+def ease_in_out_cubic(t):
+    if t < 0.5:
+        return 4 * t * t * t
+    t = 2 * t - 2
+    return 0.5 * t * t * t + 1
+
+
+def ease_out_cubic(t):
+    t -= 1
+    return t * t * t + 1
+
+
+class Tween:
+    __slots__ = ('key', 'target', 'attr', 'start', 'end', 'duration', 'elapsed', 'easing', 'on_done')
+
+    def __init__(self):
+        self.reset(None, None, None, 0, 0, 1, linear, None)
+
+    def reset(self, key, target, attr, start, end, duration, easing, on_done):
+        self.key = key
+        self.target = target
+        self.attr = attr
+        self.start = start
+        self.end = end
+        self.duration = duration
+        self.elapsed = 0
+        self.easing = easing
+        self.on_done = on_done
+
+
+class Animator:
+    def __init__(self, max_step=50):
+        # Longest step in milliseconds, so a stall or idle wake-up does not skip an animation
+        self.max_step = max_step
+
+        # Running tweens in start order, and the same tweens by key for coalescing
+        self.tweens = []
+        self.by_key = {}
+
+        # Finished tweens are kept and reused instead of allocating new ones
+        self.free = []
+
+    def animate(self, target, attr, end, duration, easing=ease_out_cubic, key=None, on_done=None):
+        """Move target.attr to end over duration milliseconds
+
+        Animating a key that is already running retargets that tween from its
+        current value instead of starting a second one.
+        """
+        if key is None:
+            key = (id(target), attr)
+        start = getattr(target, attr)
+
+        tween = self.by_key.get(key)
+        if tween is None:
+            tween = self.free.pop() if self.free else Tween()
+            self.tweens.append(tween)
+            self.by_key[key] = tween
+        tween.reset(key, target, attr, start, end, duration, easing, on_done)
+        return tween
+
+    def cancel(self, key, finish=False):
+        """Stop the tween for key, optionally jumping to its end value"""
+        tween = self.by_key.pop(key, None)
+        if tween is None:
+            return False
+        if finish:
+            setattr(tween.target, tween.attr, tween.end)
+        self.tweens.remove(tween)
+        self._release(tween)
+        return True
+
+    def cancel_all(self, finish=False):
+        """Stop every running tween"""
+        for tween in self.tweens:
+            if finish:
+                setattr(tween.target, tween.attr, tween.end)
+            self._release(tween)
+        self.tweens.clear()
+        self.by_key.clear()
+
+    def is_active(self):
+        return bool(self.tweens)
+
+    def update(self, elapsed):
+        """Advance every tween by elapsed milliseconds"""
+        if elapsed > self.max_step:
+            elapsed = self.max_step
+        tweens = self.tweens
+        count = len(tweens)
+        kept = 0
+        finished = None
+        for i in range(count):
+            tween = tweens[i]
+            tween.elapsed += elapsed
+            if tween.elapsed < tween.duration:
+                progress = tween.easing(tween.elapsed / tween.duration)
+                setattr(tween.target, tween.attr, tween.start + (tween.end - tween.start) * progress)
+                tweens[kept] = tween
+                kept += 1
+                continue
+
+            setattr(tween.target, tween.attr, tween.end)
+            del self.by_key[tween.key]
+            if tween.on_done is not None:
+                if finished is None:
+                    finished = []
+                finished.append(tween.on_done)
+            self._release(tween)
+
+        # Compact the running tweens in place
+        if kept < count:
+            del tweens[kept:]
+
+        # Callbacks run last so they can safely start new tweens
+        if finished is not None:
+            for on_done in finished:
+                on_done()
+
+    def _release(self, tween):
+        tween.target = None
+        tween.on_done = None
+        self.free.append(tween)
+
+
+class AnimatedPoint:
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
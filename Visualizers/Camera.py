@@ -0,0 +1,49 @@
+import pygame
+
+
+class Camera:
+    def __init__(self, viewport, min_zoom=0.1, max_zoom=3.0):
+        self.viewport = pygame.Rect(viewport)
+        self.min_zoom = min_zoom
+        self.max_zoom = max_zoom
+
+        # World position shown at the top-left corner of the viewport
+        self.x = 0.0
+        self.y = 0.0
+        self.zoom = 1.0
+
+    def reset(self):
+        """Return to the original position and zoom level"""
+        self.x = 0.0
+        self.y = 0.0
+        self.zoom = 1.0
+
+    def pan(self, dx, dy):
+        """Move the view by (dx, dy) screen pixels"""
+        self.x += dx / self.zoom
+        self.y += dy / self.zoom
+
+    def zoom_at(self, factor, screen_pos=None):
+        """Zoom by factor, keeping the world point under screen_pos fixed"""
+        if screen_pos is None:
+            screen_pos = self.viewport.center
+        world_x, world_y = self.screen_to_world(*screen_pos)
+        self.zoom = max(self.min_zoom, min(self.max_zoom, self.zoom * factor))
+        self.x = world_x - (screen_pos[0] - self.viewport.x) / self.zoom
+        self.y = world_y - (screen_pos[1] - self.viewport.y) / self.zoom
+
+    def world_to_screen(self, world_x, world_y):
+        """Convert a world position to integer screen coordinates"""
+        return (int(self.viewport.x + (world_x - self.x) * self.zoom),
+                int(self.viewport.y + (world_y - self.y) * self.zoom))
+
+    def screen_to_world(self, screen_x, screen_y):
+        """Convert a screen position to world coordinates"""
+        return (self.x + (screen_x - self.viewport.x) / self.zoom,
+                self.y + (screen_y - self.viewport.y) / self.zoom)
+
+    def visible_world_rect(self):
+        """Return (left, top, right, bottom) of the world area in view"""
+        return (self.x, self.y,
+                self.x + self.viewport.width / self.zoom,
+                self.y + self.viewport.height / self.zoom)
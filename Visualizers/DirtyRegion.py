@@ -0,0 +1,37 @@
+import pygame
+
+
+class DirtyRegion:
+    def __init__(self, bounds, max_rects=8):
+        self.bounds = pygame.Rect(bounds)
+        self.max_rects = max_rects
+        self.rects = []
+        self.mark_all()
+
+    def mark(self, rect):
+        """Record that rect has to be repainted"""
+        rect = pygame.Rect(rect).clip(self.bounds)
+        if rect.width == 0 or rect.height == 0:
+            return
+        for existing in self.rects:
+            if existing.contains(rect):
+                return
+        self.rects = [existing for existing in self.rects if not rect.contains(existing)]
+        self.rects.append(rect)
+
+    def mark_all(self):
+        """Record that the whole screen has to be repainted"""
+        self.rects = [self.bounds.copy()]
+
+    def is_dirty(self):
+        return bool(self.rects)
+
+    def consume(self):
+        """Return the damaged rects and reset the region"""
+        rects = self.rects
+        self.rects = []
+
+        # Many small updates cost more than one larger one
+        if len(rects) > self.max_rects:
+            rects = [rects[0].unionall(rects[1:])]
+        return rects
@@ -0,0 +1,34 @@
+import pygame
+
+
+class FrameScheduler:
+    ACTIVE = "active"  # Animations running, tick at the full frame rate
+    IDLE = "idle"  # Nothing moving, sleep until input arrives
+
+    def __init__(self, fps=60, idle_timeout=1000):
+        self.fps = fps
+        self.idle_timeout = idle_timeout  # Milliseconds to sleep before waking anyway
+        self.clock = pygame.time.Clock()
+        self.mode = self.IDLE
+
+    def next_events(self, animating):
+        """Wait for the next frame and return (events, elapsed milliseconds)
+
+        While animating this ticks at the full frame rate. Otherwise it blocks
+        on pygame.event.wait so an idle screen uses no CPU, and the frame
+        after a wake-up reports 0 ms elapsed.
+        """
+        if animating:
+            self.mode = self.ACTIVE
+            elapsed = self.clock.tick(self.fps)
+            return pygame.event.get(), elapsed
+
+        self.mode = self.IDLE
+        event = pygame.event.wait(self.idle_timeout)
+        events = [] if event.type == pygame.NOEVENT else [event]
+        events.extend(pygame.event.get())
+
+        # Nothing was moving while asleep, so the wait is not frame time;
+        # the tick only restarts the clock for the next active frame
+        self.clock.tick()
+        return events, 0
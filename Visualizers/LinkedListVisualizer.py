@@ -1,10 +1,16 @@
 import pygame
 import sys
 import time
-import math
-import tkinter as tk
-from tkinter import simpledialog, messagebox
 from DataStructures.LinkedList import LinkedList, Node
+from DataStructures.Observable import Inserted, Removed, Updated
+from DataStructures.ListSort import SortMerge
+from Visualizers.TextCache import TextCache
+from Visualizers.Camera import Camera
+from Visualizers.SpriteAtlas import NodeSpriteAtlas
+from Visualizers.DirtyRegion import DirtyRegion
+from Visualizers.Widgets import WidgetLayer
+from Visualizers.Animation import Animator, AnimatedPoint
+from Visualizers.ListLayout import ListLayout
 
 class LinkedListVisualizer:
     def __init__(self, win, width, height):
@@ -27,15 +33,57 @@ class LinkedListVisualizer:
         self.NODE_SPACING = 100  # Space between nodes
         self.STARTING_X = 100
         self.STARTING_Y = height // 2
+        self.ROW_SPACING = 100  # Space between wrapped rows
+        self.NODES_PER_ROW = max(1, (width - self.NODE_RADIUS - self.STARTING_X) // self.NODE_SPACING + 1)
+        self.LABEL_MARGIN = 25  # Room for the Head/Tail labels around a node
+
+        # Camera over the list area (everything above the instructions and buttons)
+        self.camera = Camera(pygame.Rect(0, 0, width, height - 110))
+        self.PAN_STEP = 50
+        self.ZOOM_STEP = 1.1
+
+        # Node slots and their positions, shared by drawing and hit-testing
+        self.layout = ListLayout(self.STARTING_X, self.STARTING_Y, self.NODE_SPACING,
+                                 self.ROW_SPACING, self.NODES_PER_ROW)
+        self.highlighted = None  # Node selected by clicking on it
+
+        # Only damaged areas are repainted and pushed to the display
+        self.dirty = DirtyRegion((0, 0, width, height))
+        self.length_rect = pygame.Rect(10, 10, 200, 30)
+        self.instruction_rect = pygame.Rect(10, height - 100, width - 20, 20)
         
         # Font
         pygame.font.init()
         self.font = pygame.font.SysFont('Arial', 20)
         self.small_font = pygame.font.SysFont('Arial', 16)
+
+        # Rendered text surfaces shared by every draw method
+        self.text_cache = TextCache()
+
+        # Pre-rendered node bodies and arrows, rebuilt when the zoom changes
+        self.sprites = NodeSpriteAtlas({
+            'node': self.NODE_COLOR,
+            'highlight': self.NODE_HIGHLIGHT,
+            'outline': (255, 255, 255),
+            'head': self.HEAD_COLOR,
+            'tail': self.TAIL_COLOR,
+            'arrow': self.ARROW_COLOR,
+        }, self.small_font, self.text_cache)
+
+        # In-window prompts, explanation panels and toasts
+        self.widgets = WidgetLayer(win, width, height, self.font, self.small_font,
+                                   self.text_cache, self.dirty)
         
         # Animation speed (lower is faster)
         
-        self.ANIMATION_SPEED = 0.5
+        self.ANIMATION_SPEED = 0.5  # Seconds for a node to slide into place
+        self.animator = Animator()
+        self.moving = {}  # node -> AnimatedPoint while it slides to its new position
+
+        # Merge sort in progress: the list's sort_steps generator, advanced one merge at a time
+        self.SORT_STEP_MS = 600
+        self.sorting = None
+        self.sort_elapsed = 0
         
         # Button properties
         self.buttons = []
@@ -58,7 +106,8 @@ class LinkedListVisualizer:
             ("Insert", self.insert_operation),
             ("Remove", self.remove_operation),
             ("Pop", self.pop_operation),
-            ("Pop First", self.pop_first_operation)
+            ("Pop First", self.pop_first_operation),
+            ("Sort", self.sort_operation)
         ]
         
         for i, (label, callback) in enumerate(operations):
@@ -80,98 +129,207 @@ class LinkedListVisualizer:
         """Show an educational popup explaining the operation"""
         if not self.educational_mode:
             return
-            
-        root = tk.Tk()
-        root.withdraw()
-        root.attributes("-topmost", True)
-        
-        # Create a custom dialog with better formatting
-        messagebox.showinfo(title, message, parent=root)
-        root.destroy()
+
+        # Panels queue up behind any prompt that is already open
+        self.widgets.explain(title, message)
 
 
     def set_linked_list(self, linked_list):
         """Set the linked list to visualize"""
+        if self.linked_list is not None:
+            self.linked_list.unsubscribe(self._on_list_change)
+        self.sorting = None
         self.linked_list = linked_list
+        if linked_list is not None:
+            linked_list.subscribe(self._on_list_change)
+        self.layout.rebuild(linked_list)
+        self.highlighted = None
+        self.dirty.mark_all()
     
     def create_new_list(self, value):
         """Create a new linked list with initial value"""
-        self.linked_list = LinkedList(value)
-        
-    def draw_node(self, x, y, value, is_head=False, is_tail=False, highlight=False):
-        """Draw a node at position (x, y) with the given value"""
-        # Draw the circle
-        color = self.NODE_HIGHLIGHT if highlight else self.NODE_COLOR
-        pygame.draw.circle(self.win, color, (x, y), self.NODE_RADIUS)
-        pygame.draw.circle(self.win, (255, 255, 255), (x, y), self.NODE_RADIUS, 2)
-        
-        # Draw the value
-        text = self.font.render(str(value), True, self.TEXT_COLOR)
-        text_rect = text.get_rect(center=(x, y))
-        self.win.blit(text, text_rect)
-        
-        # Indicate if it's head or tail
-        if is_head:
-            head_text = self.small_font.render("Head", True, self.HEAD_COLOR)
-            self.win.blit(head_text, (x - 20, y - self.NODE_RADIUS - 20))
-        
-        if is_tail:
-            tail_text = self.small_font.render("Tail", True, self.TAIL_COLOR)
-            self.win.blit(tail_text, (x - 15, y + self.NODE_RADIUS + 5))
-
-    def draw_arrow(self, start_x, start_y, end_x, end_y):
-        """Draw an arrow from (start_x, start_y) to (end_x, end_y)"""
-        # Calculate the angle of the arrow
-        dx = end_x - start_x
-        dy = end_y - start_y
-        angle = math.atan2(dy, dx)
-        
-        # Arrow body
-        pygame.draw.line(self.win, self.ARROW_COLOR, (start_x, start_y), (end_x, end_y), 2)
-        
-        # Arrow head
-        arrow_size = 10
-        end_x = end_x - self.NODE_RADIUS * math.cos(angle)
-        end_y = end_y - self.NODE_RADIUS * math.sin(angle)
-        
-        pygame.draw.polygon(self.win, self.ARROW_COLOR, [
-            (end_x, end_y),
-            (end_x - arrow_size * math.cos(angle - math.pi/6), end_y - arrow_size * math.sin(angle - math.pi/6)),
-            (end_x - arrow_size * math.cos(angle + math.pi/6), end_y - arrow_size * math.sin(angle + math.pi/6))
-        ])
+        self.set_linked_list(LinkedList(value))
+
+    def _on_list_change(self, change):
+        """Keep the layout in step with the list and repaint what changed"""
+        if isinstance(change, Inserted):
+            index = change.index
+            if index == len(self.layout):
+                self.layout.append(self.linked_list.tail)
+            else:
+                node = self.linked_list.head if index == 0 else self.layout.node(index - 1).next
+                self.layout.insert(index, node)
+
+            # The previous node gains an arrow or loses its Tail label
+            self._list_changed(index - 1)
+        elif isinstance(change, Removed):
+            if self.layout.node(change.index) is self.highlighted:
+                self.highlighted = None
+            self.layout.remove(change.index)
+            self._list_changed(change.index - 1)
+        elif isinstance(change, Updated):
+            self.dirty.mark(self._node_rect(change.index))
+        else:
+            self.layout.rebuild(self.linked_list)
+            self._list_changed(0)
+
+    def invalidate(self):
+        """Repaint the whole screen on the next draw"""
+        self.dirty.mark_all()
+
+    def is_animating(self):
+        """True while nodes are sliding or a toast is counting down"""
+        return self.animator.is_active() or self.widgets.is_animating() or self.sorting is not None
+
+    def _visible_positions(self):
+        """Return {node: (x, y)} for the nodes currently in view"""
+        positions = {}
+        if not self.linked_list or self.linked_list.length == 0:
+            return positions
+        start, stop = self.visible_range()
+        if start == stop:
+            return positions
+        for index in range(start, stop):
+            node = self.layout.node(index)
+            point = self.moving.get(node)
+            positions[node] = (point.x, point.y) if point else self.layout.position(index)
+        return positions
+
+    def _animate_changes(self, before):
+        """Slide the nodes in view from their positions in before to the new layout"""
+        duration = self.ANIMATION_SPEED * 1000
+        moving = {}
+        if self.linked_list.length > 0:
+            start, stop = self.visible_range()
+            for index in range(start, stop):
+                current = self.layout.node(index)
+                x, y = self.layout.position(index)
+                old = before.get(current)
+                if old is None:
+                    # New nodes drop into place from half a row above
+                    old = (x, y - self.ROW_SPACING // 2)
+                if old != (x, y):
+                    point = self.moving.get(current) or AnimatedPoint(*old)
+                    self.animator.animate(point, 'x', x, duration)
+                    self.animator.animate(point, 'y', y, duration)
+                    moving[current] = point
+
+        # Nodes that left the view or were removed stop animating
+        for node, point in self.moving.items():
+            if node not in moving:
+                self.animator.cancel((id(point), 'x'))
+                self.animator.cancel((id(point), 'y'))
+        self.moving = moving
+
+    def _list_changed(self, index=0):
+        """Repaint from index onward after the list and layout were updated"""
+        index = max(0, index)
+        self.dirty.mark(self.length_rect)
+
+        # Everything from the row holding index down to the bottom may have moved
+        viewport = self.camera.viewport
+        row_top = self.layout.position_for(index)[1] - self.NODE_RADIUS - self.LABEL_MARGIN
+        _, top = self.camera.world_to_screen(0, row_top)
+        self.dirty.mark(pygame.Rect(viewport.x, top, viewport.width, viewport.bottom - top).clip(viewport))
+
+    def _camera_changed(self):
+        """Repaint the list area after a pan or zoom"""
+        self.dirty.mark(self.camera.viewport)
+        
+    def _node_state(self, is_head, is_tail, highlight):
+        """Return the sprite atlas state for a node"""
+        if is_head and is_tail:
+            state = 'head_tail'
+        elif is_head:
+            state = 'head'
+        elif is_tail:
+            state = 'tail'
+        else:
+            return 'highlight' if highlight else 'normal'
+        return 'highlight_' + state if highlight else state
+
+    def _value_blit(self, x, y, value):
+        """Return the (surface, dest) pair for a node value centred on (x, y)"""
+        text = self.text_cache.render(self.font, str(value), self.TEXT_COLOR)
+        return text, (x - text.get_width() // 2, y - text.get_height() // 2)
+
+    def visible_range(self):
+        """Return the (start, stop) index range of nodes inside the camera view"""
+        _, top, _, bottom = self.camera.visible_world_rect()
+        return self.layout.visible_range(top, bottom, self.NODE_RADIUS + self.LABEL_MARGIN)
+
+    def _node_rect(self, index):
+        """Screen area covered by the node at index and its labels"""
+        x, y = self.camera.world_to_screen(*self.layout.position(index))
+        size = int((self.NODE_RADIUS + self.LABEL_MARGIN) * self.camera.zoom) + 20
+        return pygame.Rect(x - size, y - size, 2 * size, 2 * size)
+
+    def select_node_at(self, pos):
+        """Highlight the node under the screen position pos, if any"""
+        if not self.camera.viewport.collidepoint(pos):
+            return False
+        world_x, world_y = self.camera.screen_to_world(*pos)
+        index = self.layout.hit_test(world_x, world_y, self.NODE_RADIUS)
+        if index is None:
+            return False
+
+        node = self.layout.node(index)
+        if self.highlighted is None or node is self.highlighted:
+            self.dirty.mark(self._node_rect(index))
+        else:
+            # The previous selection may be anywhere in view
+            self.dirty.mark(self.camera.viewport)
+        self.highlighted = None if node is self.highlighted else node
+        self.widgets.show_toast(f"Index {index}: value {node.value}")
+        return True
 
     def draw_linked_list(self):
-        """Draw the entire linked list"""
+        """Draw the part of the linked list that is inside the camera view"""
         if not self.linked_list or self.linked_list.length == 0:
             # Draw "Empty List" text if there's no list
-            text = self.font.render("Empty List", True, self.TEXT_COLOR)
+            text = self.text_cache.render(self.font, "Empty List", self.TEXT_COLOR)
             self.win.blit(text, (self.width // 2 - 50, self.height // 2))
             return
-        
-        # Start drawing from the head
-        current = self.linked_list.head
-        x, y = self.STARTING_X, self.STARTING_Y
-        
-        while current:
-            is_head = (current == self.linked_list.head)
-            is_tail = (current == self.linked_list.tail)
-            
-            # Draw the node
-            self.draw_node(x, y, current.value, is_head, is_tail)
-            
+
+        start, stop = self.visible_range()
+        if start == stop:
+            return
+
+        camera = self.camera
+        radius = max(1, int(self.NODE_RADIUS * camera.zoom))
+        self.sprites.update(radius, int(self.NODE_SPACING * camera.zoom))
+        node_blit = self.sprites.node_blit
+        arrow_blit = self.sprites.arrow_blit
+        draw_values = radius >= 12
+        head = self.linked_list.head
+        tail = self.linked_list.tail
+
+        # Collect every sprite for the visible range and blit them in one batch
+        blits = []
+        moving = self.moving
+        nodes = self.layout.nodes
+        position_for = self.layout.position_for
+        highlighted = self.highlighted
+        for index in range(start, stop):
+            current = nodes[index]
+            if moving and current in moving:
+                point = moving[current]
+                x, y = camera.world_to_screen(point.x, point.y)
+            else:
+                x, y = camera.world_to_screen(*position_for(index))
+            state = self._node_state(current is head, current is tail, current is highlighted)
+            blits.append(node_blit(state, x, y))
+            if draw_values:
+                blits.append(self._value_blit(x, y, current.value))
+
             # Draw the arrow if there's a next node
-            if current.next:
-                self.draw_arrow(x + self.NODE_RADIUS, y, 
-                               x + self.NODE_SPACING - self.NODE_RADIUS, y)
-            
-            # Move to the next node position
-            x += self.NODE_SPACING
-            current = current.next
-            
-            # If we're about to go off screen, wrap to next line
-            if x + self.NODE_RADIUS > self.width:
-                x = self.STARTING_X
-                y += 100
+            if current.next and self.sprites.arrow is not None:
+                blits.append(arrow_blit(x, y))
+
+        clip = self.win.get_clip()
+        self.win.set_clip(camera.viewport.clip(clip))
+        self.win.blits(blits, False)
+        self.win.set_clip(clip)
 
     def draw_buttons(self):
         """Draw UI buttons"""
@@ -179,7 +337,7 @@ class LinkedListVisualizer:
             pygame.draw.rect(self.win, (100, 100, 100), button['rect'])
             pygame.draw.rect(self.win, (200, 200, 200), button['rect'], 2)
             
-            text = self.small_font.render(button['label'], True, self.TEXT_COLOR)
+            text = self.text_cache.render(self.small_font, button['label'], self.TEXT_COLOR)
             text_rect = text.get_rect(center=button['rect'].center)
             self.win.blit(text, text_rect)
 
@@ -189,27 +347,73 @@ class LinkedListVisualizer:
         pygame.draw.rect(self.win, color, self.edu_button['rect'])
         pygame.draw.rect(self.win, (200, 200, 200), self.edu_button['rect'], 2)
         
-        text = self.small_font.render(self.edu_button['label'], True, self.TEXT_COLOR)
+        text = self.text_cache.render(self.small_font, self.edu_button['label'], self.TEXT_COLOR)
         text_rect = text.get_rect(center=self.edu_button['rect'].center)
         self.win.blit(text, text_rect)
 
     def handle_events(self, event):
         """Handle pygame events for the visualizer"""
+        # An open prompt or panel takes all input until it closes
+        if self.widgets.handle_event(event):
+            return True
+
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left click
-                pos = pygame.mouse.get_pos()
+                pos = event.pos
                 
                 # Check educational button
                 if self.edu_button['rect'].collidepoint(pos):
                     self.educational_mode = not self.educational_mode
                     self.edu_button['label'] = 'Educational: ON' if self.educational_mode else 'Educational: OFF'
+                    self.dirty.mark(self.edu_button['rect'])
+                    self.dirty.mark(self.instruction_rect)
                     return True
                 
                 # Check operation buttons
                 for button in self.buttons:
                     if button['rect'].collidepoint(pos):
+                        # Any operation first completes a sort that is still stepping
+                        self._finish_sort()
                         button['callback']()
                         return True
+
+                # Check for a click on a node
+                if self.select_node_at(pos):
+                    return True
+
+        elif event.type == pygame.MOUSEWHEEL:
+            # Scroll to pan, hold Ctrl to zoom around the mouse
+            if pygame.key.get_mods() & pygame.KMOD_CTRL:
+                factor = self.ZOOM_STEP if event.y > 0 else 1 / self.ZOOM_STEP
+                self.camera.zoom_at(factor, pygame.mouse.get_pos())
+            else:
+                self.camera.pan(-event.x * self.PAN_STEP, -event.y * self.PAN_STEP)
+            self._camera_changed()
+            return True
+
+        elif event.type == pygame.KEYDOWN:
+            pan_keys = {
+                pygame.K_LEFT: (-self.PAN_STEP, 0),
+                pygame.K_RIGHT: (self.PAN_STEP, 0),
+                pygame.K_UP: (0, -self.PAN_STEP),
+                pygame.K_DOWN: (0, self.PAN_STEP),
+            }
+            if event.key in pan_keys:
+                self.camera.pan(*pan_keys[event.key])
+                self._camera_changed()
+                return True
+            if event.key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+                self.camera.zoom_at(self.ZOOM_STEP)
+                self._camera_changed()
+                return True
+            if event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                self.camera.zoom_at(1 / self.ZOOM_STEP)
+                self._camera_changed()
+                return True
+            if event.key == pygame.K_HOME:
+                self.camera.reset()
+                self._camera_changed()
+                return True
         return False
 
 
@@ -232,9 +436,12 @@ class LinkedListVisualizer:
                 "The tail pointer allows us to add at the end instantly!"
             )
         
-        value = self._get_input_value("Enter value to append:")
-        if value is not None:
-            self.linked_list.append(value)
+        self._get_input_value("Enter value to append:", self._append_value)
+
+    def _append_value(self, value):
+        before = self._visible_positions()
+        self.linked_list.append(value)
+        self._animate_changes(before)
 
     def prepend_operation(self):
         """Handle prepend operation with user input and educational context"""
@@ -254,9 +461,12 @@ class LinkedListVisualizer:
                 "Adding at the beginning is always fast in a linked list!"
             )
         
-        value = self._get_input_value("Enter value to prepend:")
-        if value is not None:
-            self.linked_list.prepend(value)
+        self._get_input_value("Enter value to prepend:", self._prepend_value)
+
+    def _prepend_value(self, value):
+        before = self._visible_positions()
+        self.linked_list.prepend(value)
+        self._animate_changes(before)
 
     def insert_operation(self):
         """Handle insert operation with user input and educational context"""
@@ -278,18 +488,26 @@ class LinkedListVisualizer:
                 "The further the index, the longer it takes!"
             )
         
-        index = self._get_input_value("Enter index to insert at:")
-        if index is not None:
-            value = self._get_input_value("Enter value to insert:")
-            if value is not None:
-                success = self.linked_list.insert(index, value)
-                if not success and self.educational_mode:
-                    self.show_educational_popup(
-                        "Insert Failed",
-                        f"Invalid index: {index}\n\n"
-                        f"Valid range: 0 to {self.linked_list.length}\n"
-                        "Remember: index 0 is the first position!"
-                    )
+        self._get_input_value("Enter index to insert at:", self._insert_index)
+
+    def _insert_index(self, index):
+        self._get_input_value("Enter value to insert:",
+                              lambda value: self._insert_value(index, value))
+
+    def _insert_value(self, index, value):
+        before = self._visible_positions()
+        success = self.linked_list.insert(index, value)
+        if success:
+            self._animate_changes(before)
+        elif self.educational_mode:
+            self.show_educational_popup(
+                "Insert Failed",
+                f"Invalid index: {index}\n\n"
+                f"Valid range: 0 to {self.linked_list.length}\n"
+                "Remember: index 0 is the first position!"
+            )
+        else:
+            self.widgets.show_toast(f"Invalid index: {index}")
 
     def remove_operation(self):
         """Handle remove operation with user input and educational context"""
@@ -311,16 +529,22 @@ class LinkedListVisualizer:
                 "Important: We must update pointers to 'bridge' the gap!"
             )
         
-        index = self._get_input_value("Enter index to remove:")
-        if index is not None:
-            removed = self.linked_list.remove(index)
-            if removed is None and self.educational_mode:
-                self.show_educational_popup(
-                    "Remove Failed", 
-                    f"Invalid index: {index}\n\n"
-                    f"Valid range: 0 to {self.linked_list.length - 1}\n"
-                    "The list has indices from 0 to length-1!"
-                )
+        self._get_input_value("Enter index to remove:", self._remove_index)
+
+    def _remove_index(self, index):
+        before = self._visible_positions()
+        removed = self.linked_list.remove(index)
+        if removed is not None:
+            self._animate_changes(before)
+        elif self.educational_mode:
+            self.show_educational_popup(
+                "Remove Failed", 
+                f"Invalid index: {index}\n\n"
+                f"Valid range: 0 to {self.linked_list.length - 1}\n"
+                "The list has indices from 0 to length-1!"
+            )
+        else:
+            self.widgets.show_toast(f"Invalid index: {index}")
 
     def pop_operation(self):
         """Handle pop operation with educational context"""
@@ -341,9 +565,14 @@ class LinkedListVisualizer:
                 "This is why doubly linked lists exist - they make this O(1)!"
             )
         
+        before = self._visible_positions()
         removed = self.linked_list.pop()
-        if removed is None and self.educational_mode:
+        if removed is not None:
+            self._animate_changes(before)
+        elif self.educational_mode:
             self.show_educational_popup("Pop Failed", "Cannot pop from an empty list!")
+        else:
+            self.widgets.show_toast("Cannot pop from an empty list!")
 
     def pop_first_operation(self):
         """Handle pop_first operation with educational context"""
@@ -363,12 +592,64 @@ class LinkedListVisualizer:
                 "This is an advantage over arrays where removing first element takes O(n)!"
             )
 
+        before = self._visible_positions()
         removed = self.linked_list.pop_first()
-        if removed is None and self.educational_mode:
+        if removed is not None:
+            self._animate_changes(before)
+        elif self.educational_mode:
             self.show_educational_popup("Pop First Failed", "Cannot pop from an empty list!")
+        else:
+            self.widgets.show_toast("Cannot pop from an empty list!")
 
+    def sort_operation(self):
+        """Sort the list, animating one merge step at a time"""
+        if self.educational_mode:
+            self.show_educational_popup(
+                "Sort Operation - How it Works",
+                "SORT orders the list with a bottom-up MERGE SORT.\n\n"
+                "Steps:\n"
+                "1. Treat every node as a sorted run of length 1\n"
+                "2. Walk the list, merging neighbouring runs pairwise\n"
+                "   by relinking their 'next' pointers in order\n"
+                "3. Double the run length and repeat until one run is left\n\n"
+                "No nodes are created or copied - only pointers change.\n\n"
+                "Time Complexity: O(n log n) - log n passes of O(n) each\n"
+                "Merge sort suits linked lists: it never needs random access!"
+            )
 
-
+        if self.linked_list.length < 2:
+            self.widgets.show_toast("Nothing to sort")
+            return
+        self.sorting = self.linked_list.sort_steps()
+        self.sort_elapsed = 0
+
+    def _sort_step(self):
+        """Run the sort up to its next merge and slide the nodes into their new order"""
+        before = self._visible_positions()
+        for step in self.sorting:
+            if isinstance(step, SortMerge):
+                self._animate_changes(before)
+                return
+        self.sorting = None
+        self.widgets.show_toast("Sorted")
+
+    def _finish_sort(self):
+        """Complete a running sort at once"""
+        if self.sorting is None:
+            return
+        before = self._visible_positions()
+        # Stop listening while the rest runs, or every merge's Reordered
+        # would rebuild the whole layout; one rebuild at the end does
+        self.linked_list.unsubscribe(self._on_list_change)
+        try:
+            for _ in self.sorting:
+                pass
+        finally:
+            self.linked_list.subscribe(self._on_list_change)
+        self.sorting = None
+        self.layout.rebuild(self.linked_list)
+        self._list_changed(0)
+        self._animate_changes(before)
 
 
 
@@ -408,35 +689,51 @@ class LinkedListVisualizer:
     #     """Handle pop_first operation"""
     #     self.linked_list.pop_first()
 
-    def _get_input_value(self, prompt):
-        """Get input value from user using a tkinter dialog"""
-        # Create root tkinter window but hide it
-        root = tk.Tk()
-        root.withdraw()
-        
-        # Make the dialog stay on top of the pygame window
-        root.attributes("-topmost", True)
-        
-        # Show the dialog and wait for input
-        value = simpledialog.askinteger("Input", prompt, parent=root)
-        
-        # Destroy the root window
-        root.destroy()
-        
-        # Return the input value (will be None if user cancels)
-        return value
+    def _get_input_value(self, prompt, on_submit):
+        """Ask for an integer with an in-window prompt"""
+        # on_submit(value) runs once the user confirms; cancelling skips it
+        self.widgets.prompt(prompt, on_submit)
+
+    def update(self, elapsed):
+        """Advance animations and timers by elapsed milliseconds"""
+        self.widgets.update(elapsed)
+
+        # The sort waits while a panel or prompt is open
+        if self.sorting is not None and not self.widgets.is_active():
+            self.sort_elapsed += elapsed
+            if self.sort_elapsed >= self.SORT_STEP_MS:
+                self.sort_elapsed = 0
+                self._sort_step()
+
+        if not self.moving:
+            return
+        self.animator.update(elapsed)
+        self.dirty.mark(self.camera.viewport)
+        if not self.animator.is_active():
+            self.moving = {}
+
     def draw(self):
-        """Main draw method to be called from the game loop"""
+        """Repaint the damaged areas and return them for display.update"""
+        rects = self.dirty.consume()
+        for rect in rects:
+            self.win.set_clip(rect)
+            self._paint(rect)
+        self.win.set_clip(None)
+        return rects
+
+    def _paint(self, rect):
+        """Repaint everything that overlaps rect"""
         # Draw background
-        self.win.fill(self.BACKGROUND)
+        self.win.fill(self.BACKGROUND, rect)
         
         # Draw list length
         length_text = f"Length: {self.linked_list.length if self.linked_list else 0}"
-        text_surf = self.font.render(length_text, True, self.TEXT_COLOR)
+        text_surf = self.text_cache.render(self.font, length_text, self.TEXT_COLOR)
         self.win.blit(text_surf, (10, 10))
         
         # Draw linked list
-        self.draw_linked_list()
+        if self.camera.viewport.colliderect(rect):
+            self.draw_linked_list()
         
         # Draw buttons
         self.draw_buttons()
@@ -447,5 +744,8 @@ class LinkedListVisualizer:
         # Draw instructions
         if self.educational_mode:
             instruction_text = "Educational Mode: ON - Click operations for detailed explanations"
-            text_surf = self.small_font.render(instruction_text, True, (144, 238, 144))
-            self.win.blit(text_surf, (10, self.height - 100))
\ No newline at end of file
+            text_surf = self.text_cache.render(self.small_font, instruction_text, (144, 238, 144))
+            self.win.blit(text_surf, (10, self.height - 100))
+
+        # Prompts and panels go on top of everything else
+        self.widgets.draw(rect)
@@ -0,0 +1,74 @@
+import math
+
+
+class ListLayout:
+    def __init__(self, start_x, start_y, spacing, row_spacing, per_row):
+        self.start_x = start_x
+        self.start_y = start_y
+        self.spacing = spacing
+        self.row_spacing = row_spacing
+        self.per_row = per_row
+
+        # Node reference for every index; a slot's position depends only on
+        # its index, so positions are computed rather than stored
+        self.nodes = []
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def position_for(self, index):
+        """Compute the slot position of index from the row layout"""
+        row, column = divmod(index, self.per_row)
+        return (self.start_x + column * self.spacing,
+                self.start_y + row * self.row_spacing)
+
+    def position(self, index):
+        """Return the position of the node at index"""
+        return self.position_for(index)
+
+    def node(self, index):
+        return self.nodes[index]
+
+    # Keeping the model in step with the list
+    def rebuild(self, linked_list):
+        """Lay out a whole list, walking it once"""
+        self.nodes = []
+        current = linked_list.head if linked_list else None
+        while current:
+            self.nodes.append(current)
+            current = current.next
+
+    def append(self, node):
+        """Add a node after the tail"""
+        self.nodes.append(node)
+
+    def insert(self, index, node):
+        """Insert a node at index; the suffix moves up a slot with its indices"""
+        self.nodes.insert(index, node)
+
+    def remove(self, index):
+        """Remove the node at index; the suffix moves back a slot with its indices"""
+        del self.nodes[index]
+
+    # Queries
+    def visible_range(self, top, bottom, margin):
+        """Return the (start, stop) index range whose rows overlap [top, bottom]"""
+        first_row = max(0, math.ceil((top - margin - self.start_y) / self.row_spacing))
+        last_row = math.floor((bottom + margin - self.start_y) / self.row_spacing)
+        start = min(len(self.nodes), first_row * self.per_row)
+        stop = min(len(self.nodes), (last_row + 1) * self.per_row)
+        return start, max(start, stop)
+
+    def hit_test(self, x, y, radius):
+        """Return the index of the node under world point (x, y), or None"""
+        row = round((y - self.start_y) / self.row_spacing)
+        column = round((x - self.start_x) / self.spacing)
+        if row < 0 or column < 0 or column >= self.per_row:
+            return None
+        index = row * self.per_row + column
+        if index >= len(self.nodes):
+            return None
+        node_x, node_y = self.position(index)
+        if (x - node_x) ** 2 + (y - node_y) ** 2 > radius ** 2:
+            return None
+        return index
@@ -1,5 +1,7 @@
 import pygame
 import sys
+from Visualizers.DirtyRegion import DirtyRegion
+from Visualizers.Animation import Animator, ease_out_cubic, linear
 
 class MainMenu:
     def __init__(self, win, width, height):
@@ -32,23 +34,57 @@ class MainMenu:
         self.title_y = -50
         self.title_target_y = height // 4
         self.fade_alpha = 0  # For fade-in effect
+        self.animator = Animator()
+        self.animator.animate(self, 'title_y', self.title_target_y, 700, ease_out_cubic)
+        self.animator.animate(self, 'fade_alpha', 255, 850, linear)
+
+        # Only damaged areas are repainted and pushed to the display
+        self.dirty = DirtyRegion((0, 0, width, height))
+        self.button_hover = False
+
+    def invalidate(self):
+        """Repaint the whole menu on the next draw"""
+        self.dirty.mark_all()
+
+    def _title_rect(self):
+        """Area covered by the title and subtitle"""
+        return pygame.Rect(0, int(self.title_y) - 40, self.width, 140)
         
-    def update(self):
-        # Animate title sliding down
-        if self.title_y < self.title_target_y:
-            self.title_y += 5
-            
-        # Animate fade in
-        if self.fade_alpha < 255:
-            self.fade_alpha += 5
+    def is_animating(self):
+        """True while the title is still sliding or fading in"""
+        return self.animator.is_active()
+        
+    def update(self, elapsed):
+        # Animate title sliding down and fading in, elapsed is in milliseconds
+        if not self.animator.is_active():
+            return
+        self.dirty.mark(self._title_rect())
+        self.animator.update(elapsed)
+        self.dirty.mark(self._title_rect())
             
     def draw(self):
-        # Clear the screen
-        self.win.fill(self.BACKGROUND)
+        """Repaint the damaged areas and return them for display.update"""
+        hover = self.start_button.collidepoint(pygame.mouse.get_pos())
+        if hover != self.button_hover:
+            self.button_hover = hover
+            self.dirty.mark(self.start_button)
+
+        rects = self.dirty.consume()
+        for rect in rects:
+            self.win.set_clip(rect)
+            self._paint(rect)
+        self.win.set_clip(None)
+        return rects
+
+    def _paint(self, rect):
+        # Clear the damaged area
+        self.win.fill(self.BACKGROUND, rect)
         
         # Draw title with animation
         title_text = self.title_font.render("Data Structures", True, self.TEXT_COLOR)
         subtitle_text = self.title_font.render("Visualized", True, self.TEXT_COLOR)
+        title_text.set_alpha(int(self.fade_alpha))
+        subtitle_text.set_alpha(int(self.fade_alpha))
         
         title_rect = title_text.get_rect(center=(self.width // 2, self.title_y))
         subtitle_rect = subtitle_text.get_rect(center=(self.width // 2, self.title_y + 60))
@@ -62,8 +98,9 @@ class MainMenu:
         self.win.blit(author_text, author_rect)
         
         # Draw start button with hover effect
-        mouse_pos = pygame.mouse.get_pos()
-        button_color = self.BUTTON_HOVER if self.start_button.collidepoint(mouse_pos) else self.BUTTON_COLOR
+        if not self.start_button.colliderect(rect):
+            return
+        button_color = self.BUTTON_HOVER if self.button_hover else self.BUTTON_COLOR
         
         pygame.draw.rect(self.win, button_color, self.start_button, border_radius=15)
         pygame.draw.rect(self.win, (255, 255, 255), self.start_button, 2, border_radius=15)
@@ -126,22 +163,65 @@ class SelectionMenu:
         # Structure info display
         self.selected_structure = None
         self.info_box = pygame.Rect(150, 450, 500, 100)
-        
+
+        # Only damaged areas are repainted and pushed to the display
+        self.dirty = DirtyRegion((0, 0, width, height))
+        self.hovered = None
+
+    def invalidate(self):
+        """Repaint the whole menu on the next draw"""
+        self.dirty.mark_all()
+
+    def is_animating(self):
+        """The selection screen only changes in response to input"""
+        return False
+
+    def _update_hover(self):
+        """Mark the buttons and info box whose hover state changed"""
+        mouse_pos = pygame.mouse.get_pos()
+        hovered = None
+        for button in [structure["button"] for structure in self.structures] + [self.back_button]:
+            if button.collidepoint(mouse_pos):
+                hovered = button
+        if hovered == self.hovered:
+            return
+        for button in (self.hovered, hovered):
+            if button is not None:
+                self.dirty.mark(button)
+        self.hovered = hovered
+
+        # Update selected structure for info display
+        for structure in self.structures:
+            if structure["button"] == hovered and structure is not self.selected_structure:
+                self.selected_structure = structure
+                self.dirty.mark(self.info_box)
+
     def draw(self):
-        # Clear the screen
-        self.win.fill(self.BACKGROUND)
+        """Repaint the damaged areas and return them for display.update"""
+        self._update_hover()
+        rects = self.dirty.consume()
+        for rect in rects:
+            self.win.set_clip(rect)
+            self._paint(rect)
+        self.win.set_clip(None)
+        return rects
+
+    def _paint(self, rect):
+        # Clear the damaged area
+        self.win.fill(self.BACKGROUND, rect)
         
         # Draw title
         title_text = self.title_font.render("Select a Data Structure", True, self.TEXT_COLOR)
         title_rect = title_text.get_rect(center=(self.width // 2, 70))
-        self.win.blit(title_text, title_rect)
+        if title_rect.colliderect(rect):
+            self.win.blit(title_text, title_rect)
         
         # Draw structure buttons
-        mouse_pos = pygame.mouse.get_pos()
-        
         for structure in self.structures:
             button = structure["button"]
-            is_hover = button.collidepoint(mouse_pos)
+            if not button.colliderect(rect):
+                continue
+            is_hover = button == self.hovered
             button_color = self.BUTTON_HOVER if is_hover else self.BUTTON_COLOR
             
             # Draw button
@@ -152,13 +232,9 @@ class SelectionMenu:
             text = self.button_font.render(structure["name"], True, self.BUTTON_TEXT)
             text_rect = text.get_rect(center=button.center)
             self.win.blit(text, text_rect)
-            
-            # Update selected structure for info display
-            if is_hover:
-                self.selected_structure = structure
         
         # Draw back button
-        back_color = self.BUTTON_HOVER if self.back_button.collidepoint(mouse_pos) else self.BUTTON_COLOR
+        back_color = self.BUTTON_HOVER if self.back_button == self.hovered else self.BUTTON_COLOR
         pygame.draw.rect(self.win, back_color, self.back_button, border_radius=5)
         pygame.draw.rect(self.win, (255, 255, 255), self.back_button, 2, border_radius=5)
         
@@ -167,6 +243,8 @@ class SelectionMenu:
         self.win.blit(back_text, back_text_rect)
         
         # Draw info box
+        if not self.info_box.colliderect(rect):
+            return
         pygame.draw.rect(self.win, (50, 50, 50), self.info_box, border_radius=5)
         pygame.draw.rect(self.win, (150, 150, 150), self.info_box, 2, border_radius=5)
         
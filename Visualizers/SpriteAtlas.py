@@ -0,0 +1,107 @@
+import pygame
+
+
+class NodeSpriteAtlas:
+    def __init__(self, colors, label_font, text_cache):
+        # colors holds 'node', 'highlight', 'outline', 'head', 'tail' and 'arrow'
+        self.colors = colors
+        self.label_font = label_font
+        self.text_cache = text_cache
+
+        # Geometry the current sprites were rendered for
+        self.radius = None
+        self.spacing = None
+
+        # state -> (surface, (center_x, center_y) inside the surface)
+        self.nodes = {}
+        self.arrow = None
+        self.arrow_offset = (0, 0)
+        self.rebuilds = 0
+
+    def update(self, radius, spacing):
+        """Re-render the sprites only when the node radius or spacing changed"""
+        if radius == self.radius and spacing == self.spacing:
+            return
+        self.radius = radius
+        self.spacing = spacing
+        self.rebuilds += 1
+
+        body = self._render_body(radius, self.colors['node'])
+        highlight = self._render_body(radius, self.colors['highlight'])
+        labels = radius >= 12
+        self.nodes = {
+            'normal': (body, (radius, radius)),
+            'highlight': (highlight, (radius, radius)),
+            'head': self._render_labelled(body, radius, head=labels),
+            'tail': self._render_labelled(body, radius, tail=labels),
+            'head_tail': self._render_labelled(body, radius, head=labels, tail=labels),
+            'highlight_head': self._render_labelled(highlight, radius, head=labels),
+            'highlight_tail': self._render_labelled(highlight, radius, tail=labels),
+            'highlight_head_tail': self._render_labelled(highlight, radius, head=labels, tail=labels),
+        }
+        self._render_arrow(radius, spacing)
+
+    def _new_surface(self, width, height):
+        return pygame.Surface((width, height), pygame.SRCALPHA)
+
+    def _finish(self, surface):
+        # convert_alpha needs a display mode, so skip it when there is none
+        if pygame.display.get_surface() is not None:
+            return surface.convert_alpha()
+        return surface
+
+    def _render_body(self, radius, color):
+        """Render the filled and outlined circle of a node"""
+        size = 2 * radius + 1
+        surface = self._new_surface(size, size)
+        pygame.draw.circle(surface, color, (radius, radius), radius)
+        pygame.draw.circle(surface, self.colors['outline'], (radius, radius), radius, 2)
+        return self._finish(surface)
+
+    def _render_labelled(self, body, radius, head=False, tail=False):
+        """Render a node body with its Head and/or Tail label baked in"""
+        label_band = 25
+        half_width = max(radius, 40)
+        surface = self._new_surface(2 * half_width + 1, 2 * (radius + label_band) + 1)
+        center_x, center_y = half_width, radius + label_band
+        surface.blit(body, (center_x - radius, center_y - radius))
+
+        if head:
+            head_text = self.text_cache.render(self.label_font, "Head", self.colors['head'])
+            surface.blit(head_text, (center_x - 20, center_y - radius - 20))
+        if tail:
+            tail_text = self.text_cache.render(self.label_font, "Tail", self.colors['tail'])
+            surface.blit(tail_text, (center_x - 15, center_y + radius + 5))
+        return self._finish(surface), (center_x, center_y)
+
+    def _render_arrow(self, radius, spacing):
+        """Render the horizontal arrow that joins two neighbouring nodes"""
+        length = spacing - 2 * radius
+        if length <= 0:
+            self.arrow = None
+            return
+
+        arrow_size = 10
+        half_height = arrow_size // 2 + 1
+        surface = self._new_surface(length + 1, 2 * half_height + 1)
+        pygame.draw.line(surface, self.colors['arrow'], (0, half_height), (length, half_height), 2)
+
+        # The head sits one radius short of the next node, outside its circle
+        tip = length - radius
+        pygame.draw.polygon(surface, self.colors['arrow'], [
+            (tip, half_height),
+            (tip - arrow_size * 0.866, half_height - arrow_size * 0.5),
+            (tip - arrow_size * 0.866, half_height + arrow_size * 0.5)
+        ])
+        self.arrow = self._finish(surface)
+        self.arrow_offset = (-radius, half_height)
+
+    def node_blit(self, state, x, y):
+        """Return the (surface, dest) pair that draws a node centred on (x, y)"""
+        surface, (center_x, center_y) = self.nodes[state]
+        return surface, (x - center_x, y - center_y)
+
+    def arrow_blit(self, x, y):
+        """Return the (surface, dest) pair for the arrow leaving the node at (x, y)"""
+        offset_x, offset_y = self.arrow_offset
+        return self.arrow, (x - offset_x, y - offset_y)
@@ -0,0 +1,44 @@
+from collections import OrderedDict
+
+
+class TextCache:
+    def __init__(self, max_size=512):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color):
+        """Return a rendered text surface, reusing a cached one when possible"""
+        key = (font, text, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, True, color)
+        self.surfaces[key] = surface
+
+        # Evict the least recently used surface once the cache is full
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def stats(self):
+        """Return hit/miss counters and the current cache size"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self.surfaces),
+            'max_size': self.max_size,
+        }
+
+    def clear(self):
+        """Drop every cached surface and reset the counters"""
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,236 @@
+import pygame
+
+
+class InputBox:
+    def __init__(self, prompt, on_submit, numeric=True):
+        self.prompt = prompt
+        self.on_submit = on_submit
+        self.numeric = numeric
+        self.text = ""
+
+    def handle_key(self, event):
+        """Edit the text; return 'submit', 'cancel' or None"""
+        if event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
+            return 'submit' if self.value() is not None else None
+        if event.key == pygame.K_ESCAPE:
+            return 'cancel'
+        if event.key == pygame.K_BACKSPACE:
+            self.text = self.text[:-1]
+            return None
+
+        char = event.unicode
+        if not char or not char.isprintable():
+            return None
+        if self.numeric and not (char.isdigit() or (char == '-' and self.text == "")):
+            return None
+        if len(self.text) < 12:
+            self.text += char
+        return None
+
+    def value(self):
+        """Return the entered value, or None if it is not valid yet"""
+        if not self.numeric:
+            return self.text
+        try:
+            return int(self.text)
+        except ValueError:
+            return None
+
+
+class ModalPanel:
+    def __init__(self, title, message, on_close=None):
+        self.title = title
+        self.lines = message.split("\n")
+        self.on_close = on_close
+
+
+class Toast:
+    def __init__(self, message, duration):
+        self.message = message
+        self.remaining = duration  # Milliseconds left on screen
+
+
+class WidgetLayer:
+    def __init__(self, win, width, height, title_font, body_font, text_cache, dirty):
+        self.win = win
+        self.width = width
+        self.height = height
+        self.title_font = title_font
+        self.body_font = body_font
+        self.text_cache = text_cache
+        self.dirty = dirty
+
+        # Colors
+        self.PANEL_COLOR = (45, 45, 45)
+        self.BORDER_COLOR = (200, 200, 200)
+        self.TEXT_COLOR = (255, 255, 255)
+        self.FIELD_COLOR = (20, 20, 20)
+        self.BUTTON_COLOR = (70, 130, 180)
+        self.TOAST_COLOR = (60, 60, 60)
+
+        # Modal widgets are shown one at a time, in the order they were requested
+        self.modals = []
+        self.toast = None
+        self.TOAST_DURATION = 2500
+
+        self.modal_rect = None
+        self.ok_rect = None
+        self.toast_rect = pygame.Rect(0, 50, 0, 0)
+
+        # Dims whatever is behind an open modal
+        self.shade = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.shade.fill((0, 0, 0, 140))
+
+    # Requests from the visualizer
+    def prompt(self, prompt, on_submit, numeric=True):
+        """Ask for a value; on_submit(value) runs once the user confirms"""
+        self._push(InputBox(prompt, on_submit, numeric))
+
+    def explain(self, title, message, on_close=None):
+        """Show a modal explanation panel"""
+        self._push(ModalPanel(title, message, on_close))
+
+    def show_toast(self, message):
+        """Show a short message that disappears on its own"""
+        if self.toast is not None:
+            self.dirty.mark(self.toast_rect)
+        self.toast = Toast(message, self.TOAST_DURATION)
+        self.toast_rect = self._toast_rect()
+        self.dirty.mark(self.toast_rect)
+
+    def is_active(self):
+        """True while a modal widget is taking the input"""
+        return bool(self.modals)
+
+    def is_animating(self):
+        """True while a toast is counting down"""
+        return self.toast is not None
+
+    def _push(self, widget):
+        self.modals.append(widget)
+        if len(self.modals) == 1:
+            self._layout()
+
+    def _close(self):
+        """Close the current modal and show the next one, if any"""
+        widget = self.modals.pop(0)
+        self.dirty.mark_all()
+        if self.modals:
+            self._layout()
+        return widget
+
+    # Game loop hooks
+    def update(self, elapsed):
+        """Count down the toast timer"""
+        if self.toast is None:
+            return
+        self.toast.remaining -= elapsed
+        if self.toast.remaining <= 0:
+            self.toast = None
+            self.dirty.mark(self.toast_rect)
+
+    def handle_event(self, event):
+        """Route input to the current modal; return True if it was consumed"""
+        if not self.modals:
+            return False
+        widget = self.modals[0]
+
+        if isinstance(widget, InputBox):
+            if event.type == pygame.KEYDOWN:
+                action = widget.handle_key(event)
+                self.dirty.mark(self.modal_rect)
+                if action == 'submit':
+                    value = widget.value()
+                    self._close()
+                    widget.on_submit(value)
+                elif action == 'cancel':
+                    self._close()
+        else:
+            close = (event.type == pygame.KEYDOWN and
+                     event.key in (pygame.K_RETURN, pygame.K_KP_ENTER, pygame.K_ESCAPE, pygame.K_SPACE))
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                close = self.ok_rect.collidepoint(event.pos)
+            if close:
+                self._close()
+                if widget.on_close is not None:
+                    widget.on_close()
+
+        # A modal blocks everything underneath it
+        return event.type in (pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN,
+                              pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL, pygame.TEXTINPUT)
+
+    # Layout
+    def _layout(self):
+        """Size the panel for the modal at the front of the queue"""
+        widget = self.modals[0]
+        padding = 20
+        line_height = self.body_font.get_linesize()
+        if isinstance(widget, InputBox):
+            width = max(320, self.body_font.size(widget.prompt)[0] + 2 * padding)
+            height = 150
+        else:
+            title_width = self.title_font.size(widget.title)[0]
+            line_width = max(self.body_font.size(line)[0] for line in widget.lines)
+            width = max(title_width, line_width) + 2 * padding
+            height = 40 + len(widget.lines) * line_height + 70
+
+        width = min(width, self.width - 40)
+        height = min(height, self.height - 40)
+        self.modal_rect = pygame.Rect(0, 0, width, height)
+        self.modal_rect.center = (self.width // 2, self.height // 2)
+        self.ok_rect = pygame.Rect(0, 0, 80, 30)
+        self.ok_rect.midbottom = (self.modal_rect.centerx, self.modal_rect.bottom - 15)
+        self.dirty.mark_all()
+
+    def _toast_rect(self):
+        text_width, text_height = self.body_font.size(self.toast.message)
+        rect = pygame.Rect(0, 0, text_width + 30, text_height + 16)
+        rect.midtop = (self.width // 2, 50)
+        return rect
+
+    # Drawing
+    def draw(self, rect):
+        """Paint the widgets that overlap rect"""
+        if self.toast is not None and self.toast_rect.colliderect(rect):
+            self._draw_box(self.toast_rect, self.TOAST_COLOR)
+            self._blit_centered(self.body_font, self.toast.message, self.toast_rect.center)
+
+        if not self.modals:
+            return
+        self.win.blit(self.shade, (0, 0))
+        if not self.modal_rect.colliderect(rect):
+            return
+
+        widget = self.modals[0]
+        panel = self.modal_rect
+        self._draw_box(panel, self.PANEL_COLOR)
+        if isinstance(widget, InputBox):
+            self._blit_centered(self.body_font, widget.prompt, (panel.centerx, panel.y + 30))
+            field = pygame.Rect(panel.x + 20, panel.y + 55, panel.width - 40, 36)
+            pygame.draw.rect(self.win, self.FIELD_COLOR, field)
+            pygame.draw.rect(self.win, self.BORDER_COLOR, field, 1)
+            text = self.text_cache.render(self.title_font, widget.text + "|", self.TEXT_COLOR)
+            self.win.blit(text, (field.x + 8, field.centery - text.get_height() // 2))
+            hint = "Enter to confirm, Esc to cancel"
+            self._blit_centered(self.body_font, hint, (panel.centerx, panel.bottom - 25))
+            return
+
+        self._blit_centered(self.title_font, widget.title, (panel.centerx, panel.y + 22))
+        line_height = self.body_font.get_linesize()
+        y = panel.y + 45
+        for line in widget.lines:
+            if line:
+                text = self.text_cache.render(self.body_font, line, self.TEXT_COLOR)
+                self.win.blit(text, (panel.x + 20, y))
+            y += line_height
+
+        self._draw_box(self.ok_rect, self.BUTTON_COLOR)
+        self._blit_centered(self.body_font, "OK", self.ok_rect.center)
+
+    def _draw_box(self, rect, color):
+        pygame.draw.rect(self.win, color, rect, border_radius=5)
+        pygame.draw.rect(self.win, self.BORDER_COLOR, rect, 2, border_radius=5)
+
+    def _blit_centered(self, font, text, center):
+        surface = self.text_cache.render(font, text, self.TEXT_COLOR)
+        self.win.blit(surface, surface.get_rect(center=center))
@@ -2,23 +2,36 @@
 # 03/18/2025
 # This is a project utilizing the pygame library to visualize data structures
 
+import os
+import sys
 import pygame
 from DataStructures.LinkedList import LinkedList
 from Visualizers.LinkedListVisualizer import LinkedListVisualizer
 from Visualizers.MenuSystem import MainMenu, SelectionMenu
+from Visualizers.FrameScheduler import FrameScheduler
 # Constants and Variables
 # Window dimensions
 WIDTH = 800
 HEIGHT = 600
-WIN = pygame.display.set_mode((WIDTH,HEIGHT))
-pygame.display.set_caption("Data Structures Visualized")
 
-# Clock 
-clock = pygame.time.Clock()
+# Frame rate while something is animating
+FPS = 60
 
-def main():
-    # Init pygame
+def create_window(headless=False):
+    """Init pygame and open the window, offscreen on SDL's dummy driver if headless"""
+    if headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
     pygame.init()
+    win = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Data Structures Visualized")
+    return win
+
+def main(headless=False):
+    # Init pygame
+    WIN = create_window(headless)
+
+    # Frame scheduler: full frame rate while animating, blocks on input when idle
+    scheduler = FrameScheduler(FPS)
 
     # Menu 
     main_menu = MainMenu(WIN, WIDTH, HEIGHT)
@@ -33,21 +46,40 @@ def main():
     
     running = True
     while running:
-        clock.tick(60)
-        for event in pygame.event.get():
+        if current_state == "main_menu":
+            animating = main_menu.is_animating()
+        elif current_state == "selection":
+            animating = selection_menu.is_animating()
+        else:
+            animating = visualizer is not None and visualizer.is_animating()
+
+        events, elapsed = scheduler.next_events(animating)
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
 
+            # Only damaged areas are repainted, so an uncovered or restored
+            # window needs a full repaint
+            if event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.VIDEOEXPOSE):
+                if current_state == "main_menu":
+                    main_menu.invalidate()
+                elif current_state == "selection":
+                    selection_menu.invalidate()
+                elif visualizer:
+                    visualizer.invalidate()
+
             # Handle state-specific events
             if current_state == "main_menu":
                 result = main_menu.handle_events(event)
                 if result == "selection":
                     current_state = "selection"
+                    selection_menu.invalidate()
 
             elif current_state == "selection":
                 result = selection_menu.handle_events(event)
                 if result == "main_menu":
                     current_state = "main_menu"
+                    main_menu.invalidate()
                 elif result in ["Linked List"]:
                     
                     selected_structure = result
@@ -56,8 +88,6 @@ def main():
                     # Initialize the visualizer for the selected structure
                     if selected_structure == "Linked List":
                         my_ll = LinkedList(1)
-                        LL_vis = LinkedListVisualizer(WIN, WIDTH, HEIGHT)
-                        LL_vis.set_linked_list(my_ll)
                         visualizer = LinkedListVisualizer(WIN, WIDTH, HEIGHT)
                         visualizer.set_linked_list(my_ll)
 
@@ -65,20 +95,27 @@ def main():
 
                 # handle visualizer events and check for back button
                 if visualizer:
-                    handle = visualizer.handle_events(event)
-                    if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                    handled = visualizer.handle_events(event)
+                    if not handled and event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                         current_state = "selection"
                         visualizer = None
+                        selection_menu.invalidate()
+
+        # Each screen repaints only its damaged areas and reports them
+        dirty_rects = []
         if current_state == "main_menu":
-            main_menu.update()
-            main_menu.draw()
+            main_menu.update(elapsed)
+            dirty_rects = main_menu.draw()
         elif current_state == "selection":
-            selection_menu.draw()
+            dirty_rects = selection_menu.draw()
         elif current_state == "visualization":
             if visualizer:
-                visualizer.draw()
-        pygame.display.flip()
+                visualizer.update(elapsed)
+                dirty_rects = visualizer.draw()
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
 
 
-main()
+if __name__ == "__main__":
+    main(headless="--headless" in sys.argv)
 